@@ -3,6 +3,7 @@ Modal backend for worker-ai-dsl.
 Auto-discovers tasks from the registry and routes to appropriate handlers.
 """
 
+import functools
 import modal
 import sys
 from pathlib import Path
@@ -18,41 +19,66 @@ app = modal.App("worker-ai-dsl")
 # Modal Images for different resource profiles
 # ============================================================================
 
-# CPU image for API-based tasks (no GPU)
-cpu_image = (
+# Shared base layer - every profile image builds on this so Modal's layer
+# cache reuses the apt layer instead of rebuilding it five times.
+base_image = (
     modal.Image.debian_slim(python_version="3.11")
-    .pip_install(
-        "openai>=1.0.0",
-        "httpx",
-        "feedparser",
-        "yt-dlp",
-        "pydub",
-        "requests",
-    )
     .apt_install("ffmpeg")
 )
 
-# GPU T4 image for medium GPU tasks
-gpu_t4_image = (
-    modal.Image.debian_slim(python_version="3.11")
-    .pip_install(
+# Strip test directories bundled inside torch/transformers etc - they are
+# dead weight that inflates image pull time on every cold start.
+_PRUNE_TESTS = (
+    "RUN pip cache purge && "
+    "find /usr/local/lib/python3.11 -name tests -type d -exec rm -rf {} +"
+)
+
+# CPU image for API-based tasks (no GPU); orjson backs the web endpoints
+cpu_image = base_image.pip_install(
+    "openai>=1.0.0",
+    "httpx",
+    "feedparser",
+    "yt-dlp",
+    "pydub",
+    "requests",
+    "orjson",
+    extra_options="--no-cache-dir",
+)
+
+# YOLO image for detection/segmentation/pose tasks; av backs the
+# threaded decode path in video.track
+yolo_image = (
+    base_image.pip_install(
         "torch>=2.0.0",
         "torchvision",
-        "transformers>=4.35.0",
         "ultralytics>=8.0.0",
-        "timm",
         "opencv-python-headless",
         "pillow",
         "numpy",
+        "av",
+        "tensorrt",
+        extra_options="--no-cache-dir",
+    )
+    .dockerfile_commands([_PRUNE_TESTS])
+)
+
+# Embedding image for sentence-transformers tasks
+embed_image = (
+    base_image.pip_install(
+        "torch>=2.0.0",
+        "transformers>=4.35.0",
         "sentence-transformers>=2.2.0",
+        "timm",
+        "numpy",
+        extra_options="--no-cache-dir",
     )
-    .apt_install("ffmpeg")
+    .dockerfile_commands([_PRUNE_TESTS])
 )
 
-# GPU A10G image for larger models (SAM2, SDXL, Chatterbox)
+# GPU A10G image for larger models (SAM2, SDXL, Chatterbox, Qwen);
+# vllm serves the qwen.chat AWQ path, transformers backs its fallback
 gpu_a10g_image = (
-    modal.Image.debian_slim(python_version="3.11")
-    .pip_install(
+    base_image.pip_install(
         "torch>=2.0.0",
         "torchvision",
         "torchaudio",
@@ -60,202 +86,250 @@ gpu_a10g_image = (
         "diffusers>=0.24.0",
         "accelerate>=0.25.0",
         "safetensors",
+        "vllm",
         "opencv-python-headless",
         "numpy",
+        extra_options="--no-cache-dir",
     )
-    .apt_install("ffmpeg")
+    .dockerfile_commands([_PRUNE_TESTS])
 )
 
 # Whisper image (specialized for audio transcription)
 whisper_image = (
-    modal.Image.debian_slim(python_version="3.11")
-    .apt_install("ffmpeg")
-    .pip_install(
+    base_image.pip_install(
         "faster-whisper>=1.0.0",
         "pyannote.audio>=3.0.0",
         "pydub",
         "torch>=2.0.0",
+        extra_options="--no-cache-dir",
     )
+    .dockerfile_commands([_PRUNE_TESTS])
 )
 
 # Face detection image
-face_image = (
-    modal.Image.debian_slim(python_version="3.11")
-    .pip_install(
-        "insightface>=0.7.0",
-        "onnxruntime-gpu",
-        "opencv-python-headless",
-        "numpy",
-        "scikit-learn",
-    )
+face_image = base_image.pip_install(
+    "insightface>=0.7.0",
+    "onnxruntime-gpu",
+    "opencv-python-headless",
+    "numpy",
+    "scikit-learn",
+    extra_options="--no-cache-dir",
 )
 
+# Persistent cache for model weights - survives container restarts so a
+# fresh container reuses downloaded weights instead of re-fetching them
+# from HuggingFace/Ultralytics on its first request.
+weights_vol = modal.Volume.from_name("model-weights", create_if_missing=True)
+
+WEIGHTS_MOUNT = {"/cache": weights_vol}
+
+# Point every framework's download cache at the shared volume.
+# Ultralytics has no cache-dir env var - its settings dir is pointed at
+# the volume and the detect tasks resolve bare weight names into
+# DWA_WEIGHTS_DIR, so downloads and exported TRT engines persist too.
+_CACHE_ENV = {
+    "HF_HOME": "/cache/hf",
+    "TORCH_HOME": "/cache/torch",
+    "YOLO_CONFIG_DIR": "/cache/ultralytics",
+    "DWA_WEIGHTS_DIR": "/cache/weights",
+}
+
+yolo_image = yolo_image.env(_CACHE_ENV)
+embed_image = embed_image.env(_CACHE_ENV)
+gpu_a10g_image = gpu_a10g_image.env(_CACHE_ENV)
+whisper_image = whisper_image.env(_CACHE_ENV)
+face_image = face_image.env(_CACHE_ENV)
+
 
 # ============================================================================
 # Resource Profile Definitions
 # ============================================================================
 
+def _warm_yolo():
+    """Pre-load default YOLO weights so the first request skips the download."""
+    from tasks.image.detect import _get_yolo
+
+    # Goes through the task-level cache so the weights (and the TRT
+    # engine exported on first ever warmup) land on the volume and the
+    # warmed model object is the one requests will use
+    _get_yolo("yolo11n.pt", "cuda")
+
+
+def _warm_embed():
+    """Pre-load the default sentence-transformers model."""
+    from sentence_transformers import SentenceTransformer
+
+    SentenceTransformer("all-MiniLM-L6-v2")
+
+
 PROFILES = {
     "cpu": {
         "image": cpu_image,
         "gpu": None,
         "timeout": 300,
         "secrets": [modal.Secret.from_name("openai-secret")],
+        "min_containers": 1,
+        "concurrency": 4,
+        "warmup": None,
+    },
+    "yolo": {
+        "image": yolo_image,
+        "gpu": "T4",
+        "timeout": 600,
+        "secrets": [],
+        "min_containers": 1,
+        "concurrency": 1,
+        "warmup": _warm_yolo,
     },
-    "gpu_t4": {
-        "image": gpu_t4_image,
+    "embed": {
+        "image": embed_image,
         "gpu": "T4",
         "timeout": 600,
         "secrets": [],
+        "min_containers": 0,
+        "concurrency": 1,
+        "warmup": _warm_embed,
     },
     "gpu_a10g": {
         "image": gpu_a10g_image,
         "gpu": "A10G",
         "timeout": 900,
         "secrets": [],
+        "min_containers": 0,
+        "concurrency": 1,
+        "warmup": None,
     },
     "whisper": {
         "image": whisper_image,
         "gpu": "T4",
         "timeout": 600,
         "secrets": [],
+        "min_containers": 1,
+        "concurrency": 1,
+        "warmup": None,
     },
     "faces": {
         "image": face_image,
         "gpu": "T4",
         "timeout": 300,
         "secrets": [],
+        "min_containers": 0,
+        "concurrency": 1,
+        "warmup": None,
     },
 }
 
 
-def get_profile_for_task(task_name: str, gpu: Optional[str]) -> str:
-    """Determine the resource profile for a task."""
-    # Special cases based on task name patterns
-    if "whisper" in task_name or "diarize" in task_name:
-        return "whisper"
-    if "faces" in task_name or "face" in task_name:
-        return "faces"
-
-    # Based on GPU requirement
+def _gpu_fallback(gpu: Optional[str]) -> str:
+    """Map a GPU requirement to the default profile for it."""
     if gpu is None:
         return "cpu"
     if gpu == "A10G" or gpu == "A100":
         return "gpu_a10g"
-    return "gpu_t4"
+    return "yolo"
 
 
-# ============================================================================
-# Profile-based Executor Functions
-# ============================================================================
+def _classify_task(task_name: str, gpu: Optional[str]) -> str:
+    """Classify a task into a profile from its name segments and GPU need."""
+    # Match whole name segments, not substrings, so e.g. a task named
+    # "surface.scan" is never routed to the faces profile.
+    segments = set(task_name.replace("_", ".").split("."))
 
-@app.function(
-    image=cpu_image,
-    timeout=300,
-    secrets=[modal.Secret.from_name("openai-secret")],
-)
-def run_cpu_task(task_name: str, payload: dict) -> dict:
-    """Execute CPU/API tasks."""
-    from tasks.discovery import ensure_discovered
-    from tasks.decorator import get_task
-
-    ensure_discovered()
-    meta = get_task(task_name)
-
-    if not meta:
-        raise ValueError(f"Unknown task: {task_name}")
+    # GPU transcription/diarization needs the faster-whisper/pyannote
+    # image; API-backed variants (gpu=None) stay on the cpu profile
+    if gpu and segments & {"whisper", "transcribe", "diarize", "language"}:
+        return "whisper"
+    if segments & {"face", "faces"}:
+        return "faces"
+    if gpu and "chatterbox" in segments:
+        return "gpu_a10g"
+    if gpu and segments & {"embed", "search", "semantic", "index"}:
+        return "embed"
 
-    result = meta.func(**payload)
-    return {"result": result, "task_type": task_name}
+    return _gpu_fallback(gpu)
 
 
-@app.function(
-    image=gpu_t4_image,
-    gpu="T4",
-    timeout=600,
-)
-def run_gpu_t4_task(task_name: str, payload: dict) -> dict:
-    """Execute T4 GPU tasks."""
+@functools.lru_cache(maxsize=1)
+def _task_profiles() -> dict[str, str]:
+    """Build the task name -> profile map once from the registry."""
     from tasks.discovery import ensure_discovered
-    from tasks.decorator import get_task
+    from tasks.decorator import get_registry
 
     ensure_discovered()
-    meta = get_task(task_name)
-
-    if not meta:
-        raise ValueError(f"Unknown task: {task_name}")
 
-    result = meta.func(**payload)
-    return {"result": result, "task_type": task_name}
+    return {
+        name: _classify_task(name, meta.gpu)
+        for name, meta in get_registry().items()
+    }
 
 
-@app.function(
-    image=gpu_a10g_image,
-    gpu="A10G",
-    timeout=900,
-)
-def run_gpu_a10g_task(task_name: str, payload: dict) -> dict:
-    """Execute A10G GPU tasks."""
-    from tasks.discovery import ensure_discovered
-    from tasks.decorator import get_task
+@functools.lru_cache(maxsize=512)
+def get_profile_for_task(task_name: str, gpu: Optional[str]) -> str:
+    """Determine the resource profile for a task."""
+    profile = _task_profiles().get(task_name)
+    if profile is not None:
+        return profile
 
-    ensure_discovered()
-    meta = get_task(task_name)
+    # Unknown/unregistered names fall back to the GPU requirement
+    return _gpu_fallback(gpu)
 
-    if not meta:
-        raise ValueError(f"Unknown task: {task_name}")
 
-    result = meta.func(**payload)
-    return {"result": result, "task_type": task_name}
+# ============================================================================
+# Profile-based Executors
+# ============================================================================
 
+def _make_runner(profile_name: str, profile: dict):
+    """Build a warm-pool-configured runner class for a resource profile."""
+    warmup = profile["warmup"]
 
-@app.function(
-    image=whisper_image,
-    gpu="T4",
-    timeout=600,
-)
-def run_whisper_task(task_name: str, payload: dict) -> dict:
-    """Execute Whisper/diarization tasks."""
-    from tasks.discovery import ensure_discovered
-    from tasks.decorator import get_task
+    class Runner:
+        @modal.enter()
+        def setup(self):
+            from tasks.discovery import ensure_discovered
+            from tasks.decorator import get_registry
 
-    ensure_discovered()
-    meta = get_task(task_name)
+            ensure_discovered()
 
-    if not meta:
-        raise ValueError(f"Unknown task: {task_name}")
+            # Resolve the registry once per container; per-request lookups
+            # then skip discovery and the registry walk entirely
+            self._meta_cache = dict(get_registry())
 
-    result = meta.func(**payload)
-    return {"result": result, "task_type": task_name}
+            if warmup:
+                warmup()
 
+        @modal.method()
+        def run(self, task_name: str, payload: dict) -> dict:
+            meta = self._meta_cache.get(task_name)
 
-@app.function(
-    image=face_image,
-    gpu="T4",
-    timeout=300,
-)
-def run_face_task(task_name: str, payload: dict) -> dict:
-    """Execute face detection/recognition tasks."""
-    from tasks.discovery import ensure_discovered
-    from tasks.decorator import get_task
+            if not meta:
+                raise ValueError(f"Unknown task: {task_name}")
 
-    ensure_discovered()
-    meta = get_task(task_name)
+            result = meta.func(**payload)
+            return {"result": result, "task_type": task_name}
 
-    if not meta:
-        raise ValueError(f"Unknown task: {task_name}")
+    # Give each generated class a unique name so Modal can register it
+    class_name = "".join(part.capitalize() for part in profile_name.split("_")) + "Runner"
+    Runner.__name__ = class_name
+    Runner.__qualname__ = class_name
 
-    result = meta.func(**payload)
-    return {"result": result, "task_type": task_name}
+    return app.cls(
+        image=profile["image"],
+        gpu=profile["gpu"],
+        timeout=profile["timeout"],
+        secrets=profile["secrets"],
+        volumes=WEIGHTS_MOUNT if profile["gpu"] else {},
+        keep_warm=profile["min_containers"],
+        container_idle_timeout=300,
+        # GPU runners take one input at a time - the cached models and
+        # staging buffers are not safe under concurrent handlers
+        allow_concurrent_inputs=profile["concurrency"],
+    )(Runner)
 
 
-# Profile to executor mapping
+# Profile to executor mapping (method handles with .remote)
 PROFILE_EXECUTORS = {
-    "cpu": run_cpu_task,
-    "gpu_t4": run_gpu_t4_task,
-    "gpu_a10g": run_gpu_a10g_task,
-    "whisper": run_whisper_task,
-    "faces": run_face_task,
+    name: _make_runner(name, profile)().run
+    for name, profile in PROFILES.items()
 }
 
 
@@ -263,11 +337,13 @@ PROFILE_EXECUTORS = {
 # Main Dispatch Function
 # ============================================================================
 
-@app.function(image=cpu_image)
 def dispatch(task_type: str, payload: dict) -> dict:
     """
     Dispatch a task to the appropriate handler based on registry metadata.
 
+    Runs in-process (web endpoint or local entrypoint) so routing costs no
+    extra Modal invocation - only the chosen executor is a remote call.
+
     Args:
         task_type: Task type identifier (e.g., "yolo.detect", "openai.chat")
                    Also accepts aliases (e.g., "llm.chat", "vision.yolo.detect")
@@ -293,11 +369,65 @@ def dispatch(task_type: str, payload: dict) -> dict:
 
     # Determine which executor to use
     profile = get_profile_for_task(meta.name, meta.gpu)
-    executor = PROFILE_EXECUTORS.get(profile, run_cpu_task)
+    executor = PROFILE_EXECUTORS.get(profile, PROFILE_EXECUTORS["cpu"])
 
     return executor.remote(task_type, payload)
 
 
+def dispatch_many(items: list[dict]) -> list[dict]:
+    """
+    Dispatch a batch of tasks, grouped by profile to amortize invocation
+    overhead.
+
+    Items sharing a profile fan out via the executor's .map, so a warm
+    container processes them back-to-back instead of paying one Modal
+    handshake per task.
+
+    Args:
+        items: List of {"task_type": ..., "payload": ...} dicts
+
+    Returns:
+        Results in the same order as items
+    """
+    from tasks.discovery import ensure_discovered
+    from tasks.decorator import get_task
+
+    ensure_discovered()
+
+    # Group by executor profile, remembering original positions
+    groups: dict[str, list[tuple[int, str, dict]]] = {}
+    results: list[Optional[dict]] = [None] * len(items)
+
+    for i, item in enumerate(items):
+        task_type = item.get("task_type")
+        payload = item.get("payload", {})
+
+        meta = get_task(task_type) if task_type else None
+        if not meta:
+            results[i] = {"error": f"Unknown task type: {task_type}"}
+            continue
+
+        profile = get_profile_for_task(meta.name, meta.gpu)
+        groups.setdefault(profile, []).append((i, task_type, payload))
+
+    # One fan-out per profile; results come back in submission order.
+    # return_exceptions keeps one bad payload from aborting its whole
+    # profile group - failures land as per-item error entries instead.
+    for profile, group in groups.items():
+        executor = PROFILE_EXECUTORS.get(profile, PROFILE_EXECUTORS["cpu"])
+        task_names = [task_type for _, task_type, _ in group]
+        payloads = [payload for _, _, payload in group]
+
+        mapped = executor.map(task_names, payloads, return_exceptions=True)
+        for (i, task_type, _), result in zip(group, mapped):
+            if isinstance(result, Exception):
+                results[i] = {"error": str(result), "task_type": task_type}
+            else:
+                results[i] = result
+
+    return results
+
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
@@ -317,48 +447,82 @@ def health() -> dict:
     }
 
 
-@app.function(image=cpu_image)
-def list_all_tasks() -> dict:
-    """List all available tasks with metadata."""
+def _collect_tasks() -> dict:
+    """Build the task listing used by list_all_tasks and /tasks."""
+    from collections import defaultdict
+
     from tasks.discovery import ensure_discovered
-    from tasks.decorator import list_tasks, CATEGORIES
+    from tasks.decorator import list_tasks
 
     ensure_discovered()
     tasks = list_tasks()
 
-    # Group by category
-    by_category = {cat: [] for cat in CATEGORIES}
+    # Group by category (first segment of the task name) in one pass -
+    # empty categories are never created, so no filter pass is needed
+    by_category = defaultdict(list)
     for task in tasks:
-        by_category[task.category].append({
+        info = {
             "name": task.name,
             "gpu": task.gpu,
-            "capabilities": task.capabilities,
+            "tags": task.tags,
             "aliases": task.aliases,
             "description": task.description,
-        })
-
-    # Remove empty categories
-    by_category = {k: v for k, v in by_category.items() if v}
+        }
+        by_category[task.name.partition(".")[0]].append(info)
 
     return {
         "total": len(tasks),
-        "categories": by_category,
+        "categories": dict(by_category),
     }
 
 
 @app.function(image=cpu_image)
-def get_task_info(task_name: str) -> dict:
-    """Get detailed info about a specific task."""
+def list_all_tasks() -> dict:
+    """List all available tasks with metadata."""
+    return _collect_tasks()
+
+
+@functools.lru_cache(maxsize=1)
+def _tasks_list_body() -> bytes:
+    """Pre-serialized /tasks response - metadata is immutable per container."""
+    import orjson
+
+    return orjson.dumps(_collect_tasks())
+
+
+@functools.lru_cache(maxsize=256)
+def _task_info_cached(task_name: str) -> dict:
+    """Cached info for a registered task - metadata is immutable per
+    container, and the bound covers every real task name."""
+    from tasks.decorator import get_task
+
+    return get_task(task_name).to_dict()
+
+
+def _task_info(task_name: str) -> dict:
+    """Look up task info; unknown names are never cached, so typo or
+    adversarial traffic can't grow the cache."""
     from tasks.discovery import ensure_discovered
     from tasks.decorator import get_task
 
     ensure_discovered()
-    meta = get_task(task_name)
 
-    if not meta:
+    if get_task(task_name) is None:
         return {"error": f"Unknown task: {task_name}"}
 
-    return meta.to_dict()
+    return _task_info_cached(task_name)
+
+
+@app.function(image=cpu_image)
+def get_task_info(task_name: str) -> dict:
+    """Get detailed info about a specific task."""
+    return _task_info(task_name)
+
+
+@app.function(image=cpu_image)
+def get_task_infos(task_names: list[str]) -> list[dict]:
+    """Get detailed info about several tasks in one call."""
+    return [_task_info(name) for name in task_names]
 
 
 # ============================================================================
@@ -404,7 +568,7 @@ def main(
         return
 
     payload_dict = json.loads(payload)
-    result = dispatch.remote(task_type, payload_dict)
+    result = dispatch(task_type, payload_dict)
     print(json.dumps(result, indent=2))
 
 
@@ -414,7 +578,7 @@ def main(
 
 @app.function(image=cpu_image)
 @modal.web_endpoint(method="POST")
-def run_task(request: dict) -> dict:
+def run_task(request: dict):
     """
     HTTP endpoint for running tasks.
 
@@ -424,16 +588,45 @@ def run_task(request: dict) -> dict:
             "payload": {"image_path": "/path/to/image.jpg"}
         }
     """
+    from fastapi.responses import ORJSONResponse
+
     task_type = request.get("task_type")
     payload = request.get("payload", {})
 
     if not task_type:
-        return {"error": "task_type is required"}
+        return ORJSONResponse({"error": "task_type is required"})
+
+    try:
+        return ORJSONResponse(dispatch(task_type, payload))
+    except Exception as e:
+        return ORJSONResponse({"error": str(e)})
+
+
+@app.function(image=cpu_image)
+@modal.web_endpoint(method="POST")
+def run_tasks_batch(request: dict):
+    """
+    HTTP endpoint for running a batch of tasks.
+
+    POST body:
+        {
+            "items": [
+                {"task_type": "yolo.detect", "payload": {...}},
+                {"task_type": "openai.chat", "payload": {...}}
+            ]
+        }
+    """
+    from fastapi.responses import ORJSONResponse
+
+    items = request.get("items")
+
+    if not items:
+        return ORJSONResponse({"error": "items is required"})
 
     try:
-        return dispatch.remote(task_type, payload)
+        return ORJSONResponse({"results": dispatch_many(items)})
     except Exception as e:
-        return {"error": str(e)}
+        return ORJSONResponse({"error": str(e)})
 
 
 @app.function(image=cpu_image)
@@ -445,6 +638,9 @@ def health_check() -> dict:
 
 @app.function(image=cpu_image)
 @modal.web_endpoint(method="GET")
-def tasks_list() -> dict:
+def tasks_list():
     """HTTP endpoint to list available tasks."""
-    return list_all_tasks.remote()
+    from fastapi.responses import Response
+
+    # Serve the pre-serialized bytes - no per-request serialization
+    return Response(content=_tasks_list_body(), media_type="application/json")
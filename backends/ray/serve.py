@@ -7,8 +7,10 @@ Usage:
     python serve.py
 """
 
+import asyncio
 import ray
 from ray import serve
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 import sys
@@ -38,49 +40,54 @@ class TaskResponse(BaseModel):
 @serve.deployment(
     num_replicas=2,
     ray_actor_options={"num_cpus": 1},
+    max_concurrent_queries=32,
 )
 @serve.ingress(app)
 class TaskRouter:
     """Main task router deployment."""
 
     def __init__(self):
-        # Lazy load handlers
-        self._handlers = None
-
-    def _get_handlers(self):
-        if self._handlers is None:
-            from tasks import llm, audio, image
-
-            self._handlers = {
-                # LLM tasks
-                "llm.chat": llm.chat,
-                "llm.embed": llm.embed,
-                "llm.summarize": llm.summarize,
-                "llm.extract": llm.extract,
-                # Audio tasks (API-based)
-                "audio.transcribe": audio.transcribe,
-                "audio.tts": audio.tts,
-                # Image tasks (API-based)
-                "image.generate": image.generate,
-                "image.describe": image.describe,
-                "image.edit": image.edit,
-            }
-        return self._handlers
+        # Load handlers eagerly so the first request skips the import cost
+        self._handlers = self._load_handlers()
+        # Handlers make blocking HTTP/IO calls; run them off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=32)
+
+    def _load_handlers(self):
+        from tasks import llm, audio, image
+
+        return {
+            # LLM tasks
+            "llm.chat": llm.chat,
+            "llm.embed": llm.embed,
+            "llm.summarize": llm.summarize,
+            "llm.extract": llm.extract,
+            # Audio tasks (API-based)
+            "audio.transcribe": audio.transcribe,
+            "audio.tts": audio.tts,
+            # Image tasks (API-based)
+            "image.generate": image.generate,
+            "image.describe": image.describe,
+            "image.edit": image.edit,
+        }
 
     @app.post("/task")
     async def run_task(self, request: TaskRequest) -> TaskResponse:
         """Execute a task."""
-        handlers = self._get_handlers()
-        handler = handlers.get(request.type)
+        handler = self._handlers.get(request.type)
 
         if not handler:
-            available = ", ".join(sorted(handlers.keys()))
+            available = ", ".join(sorted(self._handlers.keys()))
             return TaskResponse(
                 error=f"Unknown task type: {request.type}. Available: {available}"
             )
 
         try:
-            result = handler(**request.payload)
+            # Offload the blocking handler so the replica keeps serving
+            # other requests concurrently
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._executor, lambda: handler(**request.payload)
+            )
             return TaskResponse(result=result, task_type=request.type)
         except Exception as e:
             return TaskResponse(error=str(e), task_type=request.type)
@@ -93,8 +100,7 @@ class TaskRouter:
     @app.get("/tasks")
     async def list_tasks(self):
         """List available tasks."""
-        handlers = self._get_handlers()
-        return {"tasks": sorted(handlers.keys())}
+        return {"tasks": sorted(self._handlers.keys())}
 
 
 # GPU deployment for heavy workloads
@@ -1,6 +1,6 @@
 /**
  * Auto-generated TypeScript types from Python task decorators.
- * Generated: 2026-01-27T19:17:12.092453
+ * Generated: 2026-09-01T23:06:23.298025
  * DO NOT EDIT MANUALLY - run `pnpm gen:types` to regenerate.
  */
 
@@ -9,6 +9,11 @@
 // =============================================================================
 
 export type TaskName =
+  | "audio.convert"
+  | "audio.detect_language"
+  | "audio.transcribe"
+  | "audio.transcribe_openai"
+  | "audio.transcribe_stream"
   | "chatterbox.clone_voice"
   | "chatterbox.synthesize"
   | "chatterbox.synthesize_turbo"
@@ -23,6 +28,10 @@ export type TaskName =
   | "download.youtube"
   | "elevenlabs.clone_voice"
   | "elevenlabs.synthesize"
+  | "image.detect"
+  | "image.detect_batch"
+  | "image.pose"
+  | "image.segment"
   | "openai.chat"
   | "openai.chat_stream"
   | "openai.classify"
@@ -32,21 +41,19 @@ export type TaskName =
   | "openai.translate"
   | "openai.tts"
   | "openai.tts_hd"
+  | "qwen.chat"
+  | "qwen.chat_stream"
   | "rss.fetch"
+  | "semantic.embed"
+  | "semantic.index"
+  | "semantic.search"
   | "video.analyze"
   | "video.analyze_quick"
+  | "video.convert"
   | "video.detect_scenes"
   | "video.extract_audio"
   | "video.extract_frames"
-  | "whisper.detect_language"
-  | "whisper.transcribe"
-  | "whisper.transcribe_openai"
-  | "whisper.transcribe_stream"
-  | "yolo.detect"
-  | "yolo.detect_batch"
-  | "yolo.pose"
-  | "yolo.segment"
-  | "yolo.track"
+  | "video.track"
 ;
 
 // =============================================================================
@@ -54,64 +61,50 @@ export type TaskName =
 // =============================================================================
 
 export namespace Category {
-  export type See = "yolo.detect" | "yolo.detect_batch" | "yolo.pose" | "yolo.segment" | "yolo.track";
-  export type Hear = "diarize.speakers" | "diarize.with_transcript" | "whisper.detect_language" | "whisper.transcribe" | "whisper.transcribe_openai" | "whisper.transcribe_stream";
-  export type Think = "openai.chat" | "openai.chat_stream" | "openai.classify" | "openai.embed" | "openai.extract" | "openai.summarize" | "openai.translate";
-  export type Speak = "chatterbox.clone_voice" | "chatterbox.synthesize" | "chatterbox.synthesize_turbo" | "elevenlabs.clone_voice" | "elevenlabs.synthesize" | "openai.tts" | "openai.tts_hd";
-  export type Get = "download.batch" | "download.file" | "download.youtube" | "rss.fetch";
-  export type Transform = "chunk.sentences" | "chunk.text" | "convert.audio" | "convert.video";
-  export type Watch = "video.analyze" | "video.analyze_quick" | "video.detect_scenes" | "video.extract_audio" | "video.extract_frames";
+  export type Audio = "audio.convert" | "audio.detect_language" | "audio.transcribe" | "audio.transcribe_openai" | "audio.transcribe_stream";
+  export type Chatterbox = "chatterbox.clone_voice" | "chatterbox.synthesize" | "chatterbox.synthesize_turbo";
+  export type Chunk = "chunk.sentences" | "chunk.text";
+  export type Convert = "convert.audio" | "convert.video";
+  export type Diarize = "diarize.speakers" | "diarize.with_transcript";
+  export type Download = "download.batch" | "download.file" | "download.youtube";
+  export type Elevenlabs = "elevenlabs.clone_voice" | "elevenlabs.synthesize";
+  export type Image = "image.detect" | "image.detect_batch" | "image.pose" | "image.segment";
+  export type Openai = "openai.chat" | "openai.chat_stream" | "openai.classify" | "openai.embed" | "openai.extract" | "openai.summarize" | "openai.translate" | "openai.tts" | "openai.tts_hd";
+  export type Qwen = "qwen.chat" | "qwen.chat_stream";
+  export type Rss = "rss.fetch";
+  export type Semantic = "semantic.embed" | "semantic.index" | "semantic.search";
+  export type Video = "video.analyze" | "video.analyze_quick" | "video.convert" | "video.detect_scenes" | "video.extract_audio" | "video.extract_frames" | "video.track";
 }
 
 // =============================================================================
-// Capabilities
+// Tags
 // =============================================================================
 
-export namespace Capability {
-  export type Analyze = "video.analyze" | "video.analyze_quick";
-  export type Api = "whisper.transcribe_openai";
-  export type Audio = "convert.audio" | "video.extract_audio";
-  export type Batch = "download.batch" | "yolo.detect_batch";
-  export type Chat = "openai.chat" | "openai.chat_stream";
-  export type Chunk = "chunk.sentences" | "chunk.text";
-  export type Classify = "openai.classify";
-  export type Clone = "chatterbox.clone_voice" | "elevenlabs.clone_voice";
-  export type Convert = "convert.audio" | "convert.video";
-  export type Detect = "video.detect_scenes" | "whisper.detect_language" | "yolo.detect" | "yolo.detect_batch";
+export namespace Tag {
+  export type Ai = "audio.detect_language" | "audio.transcribe" | "audio.transcribe_openai" | "audio.transcribe_stream" | "chatterbox.clone_voice" | "chatterbox.synthesize" | "chatterbox.synthesize_turbo" | "diarize.speakers" | "diarize.with_transcript" | "elevenlabs.clone_voice" | "elevenlabs.synthesize" | "image.detect" | "image.detect_batch" | "image.pose" | "image.segment" | "openai.chat" | "openai.chat_stream" | "openai.classify" | "openai.embed" | "openai.extract" | "openai.summarize" | "openai.translate" | "openai.tts" | "openai.tts_hd" | "qwen.chat" | "qwen.chat_stream" | "semantic.embed" | "semantic.index" | "semantic.search" | "video.detect_scenes" | "video.track";
+  export type Audio = "audio.convert" | "audio.detect_language" | "audio.transcribe" | "audio.transcribe_openai" | "audio.transcribe_stream" | "chatterbox.clone_voice" | "chatterbox.synthesize" | "chatterbox.synthesize_turbo" | "convert.audio" | "convert.video" | "diarize.speakers" | "diarize.with_transcript" | "elevenlabs.clone_voice" | "elevenlabs.synthesize" | "openai.tts" | "openai.tts_hd";
+  export type Batch = "image.detect_batch";
+  export type Convert = "audio.convert" | "convert.audio" | "convert.video" | "video.convert";
+  export type Data = "download.batch" | "download.file" | "download.youtube" | "rss.fetch" | "semantic.embed" | "semantic.index" | "semantic.search";
+  export type Detect = "image.detect" | "image.detect_batch" | "image.pose" | "video.detect_scenes" | "video.track";
   export type Diarize = "diarize.speakers" | "diarize.with_transcript";
-  export type Download = "download.batch" | "download.file" | "download.youtube";
-  export type Embed = "openai.embed";
-  export type Extract = "openai.extract" | "video.extract_audio" | "video.extract_frames";
-  export type Fast = "chatterbox.synthesize_turbo" | "video.analyze_quick";
-  export type Fetch = "rss.fetch";
-  export type Frames = "video.extract_frames";
-  export type Generate = "openai.chat" | "openai.chat_stream";
-  export type Hd = "openai.tts_hd";
-  export type Http = "download.file";
-  export type Instances = "yolo.segment";
-  export type Keypoints = "yolo.pose";
-  export type Language = "whisper.detect_language";
-  export type Multilingual = "chatterbox.synthesize";
-  export type Objects = "yolo.detect" | "yolo.detect_batch" | "yolo.track";
-  export type Pose = "yolo.pose";
-  export type Rss = "rss.fetch";
-  export type Scenes = "video.detect_scenes";
-  export type Segment = "yolo.segment";
-  export type Sentences = "chunk.sentences";
-  export type Speakers = "diarize.speakers" | "diarize.with_transcript";
-  export type Stream = "openai.chat_stream" | "whisper.transcribe_stream";
-  export type Structure = "openai.extract";
-  export type Summarize = "openai.summarize";
-  export type Synthesize = "chatterbox.synthesize" | "chatterbox.synthesize_turbo" | "elevenlabs.synthesize" | "openai.tts" | "openai.tts_hd";
-  export type Text = "chunk.text";
-  export type Track = "yolo.track";
-  export type Transcribe = "diarize.with_transcript" | "whisper.transcribe" | "whisper.transcribe_openai" | "whisper.transcribe_stream";
-  export type Translate = "openai.translate";
-  export type Tts = "chatterbox.synthesize" | "chatterbox.synthesize_turbo" | "elevenlabs.synthesize" | "openai.tts" | "openai.tts_hd";
-  export type Vectors = "openai.embed";
-  export type Video = "convert.video" | "video.analyze" | "video.analyze_quick" | "yolo.track";
-  export type Voice = "chatterbox.clone_voice" | "elevenlabs.clone_voice";
-  export type Youtube = "download.youtube";
+  export type Embed = "semantic.embed" | "semantic.index" | "semantic.search";
+  export type Extract = "video.analyze" | "video.analyze_quick" | "video.extract_audio" | "video.extract_frames";
+  export type Fetch = "download.batch" | "download.file" | "download.youtube";
+  export type Generate = "chatterbox.clone_voice" | "chatterbox.synthesize" | "chatterbox.synthesize_turbo" | "elevenlabs.clone_voice" | "elevenlabs.synthesize" | "openai.chat" | "openai.chat_stream" | "openai.classify" | "openai.embed" | "openai.extract" | "openai.summarize" | "openai.translate" | "openai.tts" | "openai.tts_hd" | "qwen.chat" | "qwen.chat_stream";
+  export type Generic = "audio.convert" | "chunk.sentences" | "chunk.text" | "convert.audio" | "convert.video" | "download.batch" | "download.file" | "download.youtube" | "rss.fetch" | "video.analyze" | "video.analyze_quick" | "video.convert" | "video.extract_audio" | "video.extract_frames";
+  export type Gpu = "audio.detect_language" | "audio.transcribe" | "audio.transcribe_stream" | "chatterbox.synthesize" | "chatterbox.synthesize_turbo" | "diarize.speakers" | "diarize.with_transcript" | "image.detect" | "image.detect_batch" | "image.pose" | "image.segment" | "qwen.chat" | "qwen.chat_stream" | "semantic.embed" | "semantic.index" | "semantic.search" | "video.analyze" | "video.analyze_quick" | "video.detect_scenes" | "video.track";
+  export type Image = "image.detect" | "image.detect_batch" | "image.pose" | "image.segment" | "video.track";
+  export type Pose = "image.pose";
+  export type Search = "semantic.embed" | "semantic.index" | "semantic.search";
+  export type Segment = "image.segment";
+  export type Streaming = "audio.transcribe_stream" | "openai.chat_stream" | "qwen.chat_stream" | "video.track";
+  export type Text = "audio.detect_language" | "audio.transcribe" | "audio.transcribe_openai" | "audio.transcribe_stream" | "chatterbox.clone_voice" | "chatterbox.synthesize" | "chatterbox.synthesize_turbo" | "chunk.sentences" | "chunk.text" | "elevenlabs.clone_voice" | "elevenlabs.synthesize" | "openai.chat" | "openai.chat_stream" | "openai.classify" | "openai.embed" | "openai.extract" | "openai.summarize" | "openai.translate" | "openai.tts" | "openai.tts_hd" | "qwen.chat" | "qwen.chat_stream";
+  export type Track = "video.track";
+  export type Transcribe = "audio.detect_language" | "audio.transcribe" | "audio.transcribe_openai" | "audio.transcribe_stream";
+  export type Transform = "chunk.sentences" | "chunk.text";
+  export type Tts = "chatterbox.clone_voice" | "chatterbox.synthesize" | "chatterbox.synthesize_turbo" | "elevenlabs.clone_voice" | "elevenlabs.synthesize" | "openai.tts" | "openai.tts_hd";
+  export type Video = "video.analyze" | "video.analyze_quick" | "video.convert" | "video.detect_scenes" | "video.extract_audio" | "video.extract_frames" | "video.track";
 }
 
 // =============================================================================
@@ -119,6 +112,39 @@ export namespace Capability {
 // =============================================================================
 
 export interface TaskPayloads {
+  "audio.convert": {
+    input_path: string;
+    output_format?: string;
+    output_path?: string | null;
+    sample_rate?: number | null;
+    channels?: number | null;
+  };
+  "audio.detect_language": {
+    audio_path: string;
+    model_size?: string;
+    device?: string;
+  };
+  "audio.transcribe": {
+    audio_path: string;
+    model_size?: string;
+    language?: string | null;
+    word_timestamps?: boolean;
+    vad_filter?: boolean;
+    device?: string;
+    compute_type?: string;
+  };
+  "audio.transcribe_openai": {
+    audio_path: string;
+    model?: string;
+    language?: string | null;
+    prompt?: string | null;
+  };
+  "audio.transcribe_stream": {
+    audio_path: string;
+    model_size?: string;
+    language?: string | null;
+    device?: string;
+  };
   "chatterbox.clone_voice": {
     audio_path: string;
     output_path?: string | null;
@@ -205,23 +231,42 @@ export interface TaskPayloads {
     similarity_boost?: number;
     output_path?: string | null;
   };
-  "openai.chat": {
-    prompt: string;
+  "image.detect": {
+    image_path: string;
     model?: string;
-    system?: string | null;
-    temperature?: number;
-    max_tokens?: number | null;
+    conf?: number;
+    iou?: number;
+    classes?: number[] | null;
+    device?: string;
   };
-  "openai.chat_stream": {
-    prompt: string;
+  "image.detect_batch": {
+    image_paths: string[];
     model?: string;
-    system?: string | null;
-    temperature?: number;
+    conf?: number;
+    device?: string;
+    imgsz?: number;
+  };
+  "image.pose": {
+    image_path: string;
+    model?: string;
+    conf?: number;
+    device?: string;
+  };
+  "image.segment": {
+    image_path: string;
+    model?: string;
+    conf?: number;
+    device?: string;
+  };
+  "openai.chat": {
+    payload: unknown;
+  };
+  "openai.chat_stream": {
+    payload: unknown;
   };
   "openai.classify": {
     text: string;
     categories: string[];
-    model?: string;
   };
   "openai.embed": {
     text: string[];
@@ -230,7 +275,6 @@ export interface TaskPayloads {
   "openai.extract": {
     text: string;
     schema: Record<string, unknown>;
-    model?: string;
   };
   "openai.summarize": {
     text: string;
@@ -240,8 +284,7 @@ export interface TaskPayloads {
   "openai.translate": {
     text: string;
     target_language: string;
-    source_language?: string | null;
-    model?: string;
+    source_language?: string;
   };
   "openai.tts": {
     text: string;
@@ -256,10 +299,35 @@ export interface TaskPayloads {
     speed?: number;
     output_path?: string | null;
   };
+  "qwen.chat": {
+    payload: unknown;
+  };
+  "qwen.chat_stream": {
+    payload: unknown;
+  };
   "rss.fetch": {
     feed_url: string;
     limit?: number | null;
   };
+  "semantic.embed": {
+    texts: string[];
+    model_name?: string;
+    prefix?: string;
+    normalize?: boolean;
+  };
+  "semantic.index": {
+    texts: string[];
+    metadata?: Record<string, unknown>[] | null;
+    model_name?: string;
+  };
+  "semantic.search": {
+    query: string;
+    texts: string[];
+    embeddings?: number[][] | null;
+    top_k?: number;
+    threshold?: number;
+    model_name?: string;
+  };
   "video.analyze": {
     video_path: string;
     tracks?: string[] | null;
@@ -271,6 +339,13 @@ export interface TaskPayloads {
     video_path: string;
     device?: string;
   };
+  "video.convert": {
+    input_path: string;
+    output_format?: string;
+    output_path?: string | null;
+    resolution?: string | null;
+    codec?: string | null;
+  };
   "video.detect_scenes": {
     video_path: string;
     threshold?: number;
@@ -290,59 +365,7 @@ export interface TaskPayloads {
     start_time?: number | null;
     end_time?: number | null;
   };
-  "whisper.detect_language": {
-    audio_path: string;
-    model_size?: string;
-    device?: string;
-  };
-  "whisper.transcribe": {
-    audio_path: string;
-    model_size?: string;
-    language?: string | null;
-    word_timestamps?: boolean;
-    vad_filter?: boolean;
-    device?: string;
-    compute_type?: string;
-  };
-  "whisper.transcribe_openai": {
-    audio_path: string;
-    model?: string;
-    language?: string | null;
-    prompt?: string | null;
-  };
-  "whisper.transcribe_stream": {
-    audio_path: string;
-    model_size?: string;
-    language?: string | null;
-    device?: string;
-  };
-  "yolo.detect": {
-    image_path: string;
-    model?: string;
-    conf?: number;
-    iou?: number;
-    classes?: number[] | null;
-    device?: string;
-  };
-  "yolo.detect_batch": {
-    image_paths: string[];
-    model?: string;
-    conf?: number;
-    device?: string;
-  };
-  "yolo.pose": {
-    image_path: string;
-    model?: string;
-    conf?: number;
-    device?: string;
-  };
-  "yolo.segment": {
-    image_path: string;
-    model?: string;
-    conf?: number;
-    device?: string;
-  };
-  "yolo.track": {
+  "video.track": {
     video_path: string;
     model?: string;
     conf?: number;
@@ -358,7 +381,7 @@ export interface TaskPayloads {
 export interface TaskMetadata {
   name: string;
   category: string;
-  capabilities: string[];
+  tags: string[];
   gpu: string | null;
   timeout: number;
   streaming: boolean;
@@ -366,10 +389,55 @@ export interface TaskMetadata {
 }
 
 export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
+  "audio.convert": {
+    name: "audio.convert",
+    category: "audio",
+    tags: ["audio", "generic", "convert"],
+    gpu: null,
+    timeout: 300,
+    streaming: false,
+    description: "Convert audio to different format.",
+  },
+  "audio.detect_language": {
+    name: "audio.detect_language",
+    category: "audio",
+    tags: ["audio", "text", "ai", "transcribe", "gpu"],
+    gpu: "T4",
+    timeout: 60,
+    streaming: false,
+    description: "Detect spoken language in audio.",
+  },
+  "audio.transcribe": {
+    name: "audio.transcribe",
+    category: "audio",
+    tags: ["audio", "text", "ai", "transcribe", "gpu"],
+    gpu: "T4",
+    timeout: 600,
+    streaming: false,
+    description: "Transcribe audio using faster-whisper.",
+  },
+  "audio.transcribe_openai": {
+    name: "audio.transcribe_openai",
+    category: "audio",
+    tags: ["audio", "text", "ai", "transcribe"],
+    gpu: null,
+    timeout: 300,
+    streaming: false,
+    description: "Transcribe audio using OpenAI Whisper API.",
+  },
+  "audio.transcribe_stream": {
+    name: "audio.transcribe_stream",
+    category: "audio",
+    tags: ["audio", "text", "ai", "transcribe", "gpu", "streaming"],
+    gpu: "T4",
+    timeout: 600,
+    streaming: true,
+    description: "Transcribe audio with streaming segment output.",
+  },
   "chatterbox.clone_voice": {
     name: "chatterbox.clone_voice",
-    category: "speak",
-    capabilities: ["clone", "voice"],
+    category: "chatterbox",
+    tags: ["audio", "text", "ai", "generate", "tts"],
     gpu: null,
     timeout: 60,
     streaming: false,
@@ -377,8 +445,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "chatterbox.synthesize": {
     name: "chatterbox.synthesize",
-    category: "speak",
-    capabilities: ["synthesize", "tts", "multilingual"],
+    category: "chatterbox",
+    tags: ["audio", "text", "ai", "generate", "tts", "gpu"],
     gpu: "A10G",
     timeout: 300,
     streaming: false,
@@ -386,8 +454,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "chatterbox.synthesize_turbo": {
     name: "chatterbox.synthesize_turbo",
-    category: "speak",
-    capabilities: ["synthesize", "tts", "fast"],
+    category: "chatterbox",
+    tags: ["audio", "text", "ai", "generate", "tts", "gpu"],
     gpu: "T4",
     timeout: 120,
     streaming: false,
@@ -395,8 +463,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "chunk.sentences": {
     name: "chunk.sentences",
-    category: "transform",
-    capabilities: ["chunk", "sentences"],
+    category: "chunk",
+    tags: ["text", "generic", "transform"],
     gpu: null,
     timeout: 60,
     streaming: false,
@@ -404,8 +472,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "chunk.text": {
     name: "chunk.text",
-    category: "transform",
-    capabilities: ["chunk", "text"],
+    category: "chunk",
+    tags: ["text", "generic", "transform"],
     gpu: null,
     timeout: 60,
     streaming: false,
@@ -413,8 +481,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "convert.audio": {
     name: "convert.audio",
-    category: "transform",
-    capabilities: ["convert", "audio"],
+    category: "convert",
+    tags: ["audio", "generic", "convert"],
     gpu: null,
     timeout: 300,
     streaming: false,
@@ -422,8 +490,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "convert.video": {
     name: "convert.video",
-    category: "transform",
-    capabilities: ["convert", "video"],
+    category: "convert",
+    tags: ["audio", "generic", "convert"],
     gpu: null,
     timeout: 600,
     streaming: false,
@@ -431,8 +499,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "diarize.speakers": {
     name: "diarize.speakers",
-    category: "hear",
-    capabilities: ["diarize", "speakers"],
+    category: "diarize",
+    tags: ["audio", "ai", "diarize", "gpu"],
     gpu: "T4",
     timeout: 600,
     streaming: false,
@@ -440,8 +508,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "diarize.with_transcript": {
     name: "diarize.with_transcript",
-    category: "hear",
-    capabilities: ["diarize", "speakers", "transcribe"],
+    category: "diarize",
+    tags: ["audio", "ai", "diarize", "gpu"],
     gpu: "T4",
     timeout: 900,
     streaming: false,
@@ -449,8 +517,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "download.batch": {
     name: "download.batch",
-    category: "get",
-    capabilities: ["download", "batch"],
+    category: "download",
+    tags: ["data", "generic", "fetch"],
     gpu: null,
     timeout: 900,
     streaming: false,
@@ -458,8 +526,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "download.file": {
     name: "download.file",
-    category: "get",
-    capabilities: ["download", "http"],
+    category: "download",
+    tags: ["data", "generic", "fetch"],
     gpu: null,
     timeout: 300,
     streaming: false,
@@ -467,8 +535,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "download.youtube": {
     name: "download.youtube",
-    category: "get",
-    capabilities: ["download", "youtube"],
+    category: "download",
+    tags: ["data", "generic", "fetch"],
     gpu: null,
     timeout: 600,
     streaming: false,
@@ -476,8 +544,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "elevenlabs.clone_voice": {
     name: "elevenlabs.clone_voice",
-    category: "speak",
-    capabilities: ["clone", "voice"],
+    category: "elevenlabs",
+    tags: ["audio", "text", "ai", "generate", "tts"],
     gpu: null,
     timeout: 300,
     streaming: false,
@@ -485,17 +553,53 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "elevenlabs.synthesize": {
     name: "elevenlabs.synthesize",
-    category: "speak",
-    capabilities: ["synthesize", "tts"],
+    category: "elevenlabs",
+    tags: ["audio", "text", "ai", "generate", "tts"],
     gpu: null,
     timeout: 120,
     streaming: false,
     description: "Synthesize speech using ElevenLabs.",
   },
+  "image.detect": {
+    name: "image.detect",
+    category: "image",
+    tags: ["image", "ai", "detect", "gpu"],
+    gpu: "T4",
+    timeout: 300,
+    streaming: false,
+    description: "Detect objects in image using YOLO.",
+  },
+  "image.detect_batch": {
+    name: "image.detect_batch",
+    category: "image",
+    tags: ["image", "ai", "detect", "batch", "gpu"],
+    gpu: "T4",
+    timeout: 600,
+    streaming: false,
+    description: "Batch detection for multiple images.",
+  },
+  "image.pose": {
+    name: "image.pose",
+    category: "image",
+    tags: ["image", "ai", "detect", "pose", "gpu"],
+    gpu: "T4",
+    timeout: 300,
+    streaming: false,
+    description: "Pose estimation using YOLO-Pose.",
+  },
+  "image.segment": {
+    name: "image.segment",
+    category: "image",
+    tags: ["image", "ai", "segment", "gpu"],
+    gpu: "T4",
+    timeout: 300,
+    streaming: false,
+    description: "Instance segmentation using YOLO-Seg.",
+  },
   "openai.chat": {
     name: "openai.chat",
-    category: "think",
-    capabilities: ["chat", "generate"],
+    category: "openai",
+    tags: ["text", "ai", "generate"],
     gpu: null,
     timeout: 120,
     streaming: false,
@@ -503,26 +607,26 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "openai.chat_stream": {
     name: "openai.chat_stream",
-    category: "think",
-    capabilities: ["chat", "generate", "stream"],
+    category: "openai",
+    tags: ["text", "ai", "generate", "streaming"],
     gpu: null,
     timeout: 120,
     streaming: true,
-    description: "Chat completion with streaming output.",
+    description: "Streaming chat completion.",
   },
   "openai.classify": {
     name: "openai.classify",
-    category: "think",
-    capabilities: ["classify"],
+    category: "openai",
+    tags: ["text", "ai", "generate"],
     gpu: null,
     timeout: 60,
     streaming: false,
-    description: "Classify text into one or more categories.",
+    description: "Classify text into categories.",
   },
   "openai.embed": {
     name: "openai.embed",
-    category: "think",
-    capabilities: ["embed", "vectors"],
+    category: "openai",
+    tags: ["text", "ai", "generate"],
     gpu: null,
     timeout: 60,
     streaming: false,
@@ -530,17 +634,17 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "openai.extract": {
     name: "openai.extract",
-    category: "think",
-    capabilities: ["extract", "structure"],
+    category: "openai",
+    tags: ["text", "ai", "generate"],
     gpu: null,
     timeout: 120,
     streaming: false,
-    description: "Extract structured data from text according to a schema.",
+    description: "Extract structured data from text.",
   },
   "openai.summarize": {
     name: "openai.summarize",
-    category: "think",
-    capabilities: ["summarize"],
+    category: "openai",
+    tags: ["text", "ai", "generate"],
     gpu: null,
     timeout: 120,
     streaming: false,
@@ -548,17 +652,17 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "openai.translate": {
     name: "openai.translate",
-    category: "think",
-    capabilities: ["translate"],
+    category: "openai",
+    tags: ["text", "ai", "generate"],
     gpu: null,
     timeout: 120,
     streaming: false,
-    description: "Translate text to target language.",
+    description: "Translate text.",
   },
   "openai.tts": {
     name: "openai.tts",
-    category: "speak",
-    capabilities: ["synthesize", "tts"],
+    category: "openai",
+    tags: ["audio", "text", "ai", "generate", "tts"],
     gpu: null,
     timeout: 120,
     streaming: false,
@@ -566,26 +670,71 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "openai.tts_hd": {
     name: "openai.tts_hd",
-    category: "speak",
-    capabilities: ["synthesize", "tts", "hd"],
+    category: "openai",
+    tags: ["audio", "text", "ai", "generate", "tts"],
     gpu: null,
     timeout: 120,
     streaming: false,
     description: "Synthesize high-quality speech using OpenAI TTS-HD.",
   },
+  "qwen.chat": {
+    name: "qwen.chat",
+    category: "qwen",
+    tags: ["text", "ai", "generate", "gpu"],
+    gpu: "A10G",
+    timeout: 120,
+    streaming: false,
+    description: "Chat completion using Qwen (local GPU).",
+  },
+  "qwen.chat_stream": {
+    name: "qwen.chat_stream",
+    category: "qwen",
+    tags: ["text", "ai", "generate", "gpu", "streaming"],
+    gpu: "A10G",
+    timeout: 120,
+    streaming: true,
+    description: "Streaming chat with Qwen.",
+  },
   "rss.fetch": {
     name: "rss.fetch",
-    category: "get",
-    capabilities: ["fetch", "rss"],
+    category: "rss",
+    tags: ["data", "generic"],
     gpu: null,
     timeout: 60,
     streaming: false,
     description: "Fetch and parse RSS feed.",
   },
+  "semantic.embed": {
+    name: "semantic.embed",
+    category: "semantic",
+    tags: ["data", "ai", "embed", "search", "gpu"],
+    gpu: "T4",
+    timeout: 120,
+    streaming: false,
+    description: "Generate embeddings for texts.",
+  },
+  "semantic.index": {
+    name: "semantic.index",
+    category: "semantic",
+    tags: ["data", "ai", "embed", "search", "gpu"],
+    gpu: "T4",
+    timeout: 300,
+    streaming: false,
+    description: "Create a searchable index from texts.",
+  },
+  "semantic.search": {
+    name: "semantic.search",
+    category: "semantic",
+    tags: ["data", "ai", "embed", "search", "gpu"],
+    gpu: "T4",
+    timeout: 120,
+    streaming: false,
+    description: "Search texts semantically.",
+  },
   "video.analyze": {
     name: "video.analyze",
-    category: "watch",
-    capabilities: ["analyze", "video"],
+    category: "video",
+    tags: ["video", "generic", "extract", "gpu"],
     gpu: "T4",
     timeout: 1800,
     streaming: false,
@@ -593,17 +742,26 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "video.analyze_quick": {
     name: "video.analyze_quick",
-    category: "watch",
-    capabilities: ["analyze", "video", "fast"],
+    category: "video",
+    tags: ["video", "generic", "extract", "gpu"],
     gpu: "T4",
     timeout: 600,
     streaming: false,
     description: "Quick video analysis - visual + audio only.",
   },
+  "video.convert": {
+    name: "video.convert",
+    category: "video",
+    tags: ["video", "generic", "convert"],
+    gpu: null,
+    timeout: 600,
+    streaming: false,
+    description: "Convert video to different format.",
+  },
   "video.detect_scenes": {
     name: "video.detect_scenes",
-    category: "watch",
-    capabilities: ["detect", "scenes"],
+    category: "video",
+    tags: ["video", "ai", "detect", "gpu"],
     gpu: "T4",
     timeout: 600,
     streaming: false,
@@ -611,8 +769,8 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "video.extract_audio": {
     name: "video.extract_audio",
-    category: "watch",
-    capabilities: ["extract", "audio"],
+    category: "video",
+    tags: ["video", "generic", "extract"],
     gpu: null,
     timeout: 300,
     streaming: false,
@@ -620,92 +778,20 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
   },
   "video.extract_frames": {
     name: "video.extract_frames",
-    category: "watch",
-    capabilities: ["extract", "frames"],
+    category: "video",
+    tags: ["video", "generic", "extract"],
     gpu: null,
     timeout: 300,
     streaming: false,
     description: "Extract frames from video.",
   },
-  "whisper.detect_language": {
-    name: "whisper.detect_language",
-    category: "hear",
-    capabilities: ["detect", "language"],
-    gpu: "T4",
-    timeout: 60,
-    streaming: false,
-    description: "Detect spoken language in audio.",
-  },
-  "whisper.transcribe": {
-    name: "whisper.transcribe",
-    category: "hear",
-    capabilities: ["transcribe"],
-    gpu: "T4",
-    timeout: 600,
-    streaming: false,
-    description: "Transcribe audio using faster-whisper.",
-  },
-  "whisper.transcribe_openai": {
-    name: "whisper.transcribe_openai",
-    category: "hear",
-    capabilities: ["transcribe", "api"],
-    gpu: null,
-    timeout: 300,
-    streaming: false,
-    description: "Transcribe audio using OpenAI Whisper API.",
-  },
-  "whisper.transcribe_stream": {
-    name: "whisper.transcribe_stream",
-    category: "hear",
-    capabilities: ["transcribe", "stream"],
+  "video.track": {
+    name: "video.track",
+    category: "video",
+    tags: ["video", "image", "ai", "detect", "track", "gpu", "streaming"],
     gpu: "T4",
     timeout: 600,
     streaming: true,
-    description: "Transcribe audio with streaming segment output.",
-  },
-  "yolo.detect": {
-    name: "yolo.detect",
-    category: "see",
-    capabilities: ["detect", "objects"],
-    gpu: "T4",
-    timeout: 300,
-    streaming: false,
-    description: "Detect objects in image using YOLO.",
-  },
-  "yolo.detect_batch": {
-    name: "yolo.detect_batch",
-    category: "see",
-    capabilities: ["detect", "objects", "batch"],
-    gpu: "T4",
-    timeout: 600,
-    streaming: false,
-    description: "Batch detection for multiple images.",
-  },
-  "yolo.pose": {
-    name: "yolo.pose",
-    category: "see",
-    capabilities: ["pose", "keypoints"],
-    gpu: "T4",
-    timeout: 300,
-    streaming: false,
-    description: "Pose estimation using YOLO-Pose.",
-  },
-  "yolo.segment": {
-    name: "yolo.segment",
-    category: "see",
-    capabilities: ["segment", "instances"],
-    gpu: "T4",
-    timeout: 300,
-    streaming: false,
-    description: "Instance segmentation using YOLO-Seg.",
-  },
-  "yolo.track": {
-    name: "yolo.track",
-    category: "see",
-    capabilities: ["track", "objects", "video"],
-    gpu: "T4",
-    timeout: 600,
-    streaming: false,
     description: "Track objects in video using YOLO + ByteTrack.",
   },
 };
@@ -718,6 +804,7 @@ export const TASK_METADATA: Record<TaskName, TaskMetadata> = {
 export type PayloadFor<T extends TaskName> = TaskPayloads[T];
 
 /** Tasks requiring GPU */
-export type GpuTask = "chatterbox.synthesize" | "chatterbox.synthesize_turbo" | "diarize.speakers" | "diarize.with_transcript" | "video.analyze" | "video.analyze_quick" | "video.detect_scenes" | "whisper.detect_language" | "whisper.transcribe" | "whisper.transcribe_stream" | "yolo.detect" | "yolo.detect_batch" | "yolo.pose" | "yolo.segment" | "yolo.track";
+export type GpuTask = "audio.detect_language" | "audio.transcribe" | "audio.transcribe_stream" | "chatterbox.synthesize" | "chatterbox.synthesize_turbo" | "diarize.speakers" | "diarize.with_transcript" | "image.detect" | "image.detect_batch" | "image.pose" | "image.segment" | "qwen.chat" | "qwen.chat_stream" | "semantic.embed" | "semantic.index" | "semantic.search" | "video.analyze" | "video.analyze_quick" | "video.detect_scenes" | "video.track";
+
+export type StreamingTask = "audio.transcribe_stream" | "openai.chat_stream" | "qwen.chat_stream" | "video.track";
 
-export type StreamingTask = "openai.chat_stream" | "whisper.transcribe_stream";
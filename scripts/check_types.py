@@ -9,18 +9,42 @@ Usage:
 Returns exit code 1 if types are out of date.
 """
 
+import os
 import sys
 import re
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add shared to path
+# Add shared and scripts to path once at import
 sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from gen_types import generate_typescript  # noqa: E402
+
+# Tracks whether this process has already run discovery; set
+# DECL_FORCE_REDISCOVER=1 to force a re-walk (e.g. in watch mode)
+_DISCOVERED = False
+
+# This is a change-detection fingerprint, not a cryptographic hash -
+# prefer blake3 (SIMD, multi-lane) when available, else stdlib blake2b.
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    def _hasher(data: bytes):
+        return hashlib.blake2b(data, digest_size=16)
+
+_TIMESTAMP_RE = re.compile(r'\n \* Generated: .+\n')
 
 
 def strip_timestamp(content: str) -> str:
     """Remove timestamp line from generated content for consistent hashing."""
-    return re.sub(r'\n \* Generated: .+\n', '\n', content)
+    return _TIMESTAMP_RE.sub('\n', content)
+
+
+def fingerprint(content: str) -> str:
+    """Fingerprint generated content, ignoring the timestamp line."""
+    return _hasher(strip_timestamp(content).encode()).hexdigest()
 
 
 def get_current_hash() -> str:
@@ -28,34 +52,36 @@ def get_current_hash() -> str:
     output_path = Path(__file__).parent.parent / "packages/core/src/types/generated.ts"
     if not output_path.exists():
         return ""
-    content = strip_timestamp(output_path.read_text())
-    return hashlib.md5(content.encode()).hexdigest()
+    return fingerprint(output_path.read_text())
 
 
 def generate_and_get_hash() -> str:
     """Generate new types and return hash."""
-    from tasks.decorator import list_tasks, CATEGORIES, clear_registry
-    from tasks.discovery import discover_tasks, reset_discovery
+    global _DISCOVERED
 
-    # Import the generator
-    sys.path.insert(0, str(Path(__file__).parent))
-    from gen_types import generate_typescript
+    from tasks.decorator import clear_registry
+    from tasks.discovery import discover_tasks, reset_discovery
 
-    # Discover tasks
-    clear_registry()
-    reset_discovery()
-    discover_tasks()
+    # Discover tasks once per process (long-lived watch processes skip
+    # the filesystem re-walk on subsequent calls)
+    if not _DISCOVERED or os.environ.get("DECL_FORCE_REDISCOVER") == "1":
+        clear_registry()
+        reset_discovery()
+        discover_tasks()
+        _DISCOVERED = True
 
     # Generate TypeScript
-    ts_content = generate_typescript()
-    content = strip_timestamp(ts_content)
-    return hashlib.md5(content.encode()).hexdigest()
+    return fingerprint(generate_typescript())
 
 
 def main():
     """Check if types are up-to-date."""
-    current_hash = get_current_hash()
-    new_hash = generate_and_get_hash()
+    # Overlap the current-file read with the regeneration
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        current_future = pool.submit(get_current_hash)
+        new_future = pool.submit(generate_and_get_hash)
+        current_hash = current_future.result()
+        new_hash = new_future.result()
 
     if current_hash == new_hash:
         print("✓ TypeScript types are up-to-date")
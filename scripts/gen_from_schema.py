@@ -16,36 +16,72 @@ Dependencies:
     npm install json-schema-to-typescript
 """
 
-import subprocess
+import importlib.util
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+# orjson is ~3-5x faster on schema-sized documents; fall back to stdlib
+try:
+    import orjson
+
+    def _loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def _dumps(obj: dict) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _loads(data: bytes) -> dict:
+        return json.loads(data)
+
+    def _dumps(obj: dict) -> str:
+        return json.dumps(obj)
+
 
 ROOT = Path(__file__).parent.parent
 SCHEMA_DIR = ROOT / "schemas"
 TS_OUTPUT = ROOT / "packages/core/src/types/schemas.ts"
 PY_OUTPUT = ROOT / "shared/schemas/generated.py"
 
+# Basic JSON Schema -> TypeScript type mapping (module-level so it isn't
+# rebuilt on every conversion call)
+_TYPE_MAP = {
+    "string": "string",
+    "integer": "number",
+    "number": "number",
+    "boolean": "boolean",
+    "null": "null",
+    "object": "Record<string, unknown>",
+}
+
+
+def load_schemas() -> list[tuple[Path, dict]]:
+    """Load all schema files in parallel (IO + parse are independent)."""
+    paths = sorted(SCHEMA_DIR.glob("*.schema.json"))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        schemas = pool.map(lambda p: _loads(p.read_bytes()), paths)
+        return list(zip(paths, schemas))
+
 
-def generate_typescript():
+def generate_typescript(schemas: list[tuple[Path, dict]]):
     """Generate TypeScript from JSON Schema using json-schema-to-typescript."""
     print("Generating TypeScript...")
 
+    now = datetime.now().isoformat()
+
     ts_lines = [
         "/**",
         " * Auto-generated from JSON Schema - DO NOT EDIT",
-        f" * Generated: {datetime.now().isoformat()}",
+        f" * Generated: {now}",
         " * Source: schemas/*.schema.json",
         " */",
         "",
     ]
 
     # Process each schema file
-    for schema_file in sorted(SCHEMA_DIR.glob("*.schema.json")):
-        with open(schema_file) as f:
-            schema = json.load(f)
-
+    for schema_file, schema in schemas:
         title = schema.get("title", schema_file.stem)
         ts_lines.append(f"// === {title} ===")
         ts_lines.append("")
@@ -111,16 +147,6 @@ def json_type_to_ts(schema: dict) -> str:
             enum_values.append("null")
         return " | ".join(enum_values)
 
-    # Basic type mapping
-    type_map = {
-        "string": "string",
-        "integer": "number",
-        "number": "number",
-        "boolean": "boolean",
-        "null": "null",
-        "object": "Record<string, unknown>",
-    }
-
     if schema_type == "array":
         items = schema.get("items", {})
         item_type = json_type_to_ts(items)
@@ -133,54 +159,48 @@ def json_type_to_ts(schema: dict) -> str:
             props.append(f"{k}: {json_type_to_ts(v)}")
         return "{ " + "; ".join(props) + " }"
 
-    return type_map.get(schema_type, "unknown")
+    return _TYPE_MAP.get(schema_type, "unknown")
 
 
-def generate_python():
+def generate_python(schemas: list[tuple[Path, dict]]):
     """Generate Python Pydantic models from JSON Schema."""
     print("Generating Python (Pydantic)...")
 
-    # Check if datamodel-code-generator is installed
-    try:
-        subprocess.run(["datamodel-codegen", "--version"],
-                      capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if datamodel-code-generator is installed (find_spec avoids
+    # spawning a subprocess just to probe)
+    if importlib.util.find_spec("datamodel_code_generator") is None:
         print("  ⚠ datamodel-code-generator not installed")
         print("  Run: pip install datamodel-code-generator")
         return
 
-    # Combine all schemas
+    from datamodel_code_generator import (
+        DataModelType,
+        InputFileType,
+        PythonVersion,
+        generate,
+    )
+
+    # Combine all schemas in memory - no intermediate file round-trip
     combined = {
         "$schema": "http://json-schema.org/draft-07/schema#",
         "definitions": {},
     }
 
-    for schema_file in SCHEMA_DIR.glob("*.schema.json"):
-        with open(schema_file) as f:
-            schema = json.load(f)
+    for _, schema in schemas:
         combined["definitions"].update(schema.get("definitions", {}))
 
-    # Write combined schema
-    combined_path = SCHEMA_DIR / "_combined.json"
-    with open(combined_path, "w") as f:
-        json.dump(combined, f, indent=2)
-
-    # Generate Python
+    # Generate Python in-process (skips interpreter startup per run)
     PY_OUTPUT.parent.mkdir(parents=True, exist_ok=True)
 
-    subprocess.run([
-        "datamodel-codegen",
-        "--input", str(combined_path),
-        "--input-file-type", "jsonschema",
-        "--output", str(PY_OUTPUT),
-        "--output-model-type", "pydantic_v2.BaseModel",
-        "--use-standard-collections",
-        "--use-union-operator",
-        "--target-python-version", "3.11",
-    ], check=True)
-
-    # Clean up
-    combined_path.unlink()
+    generate(
+        _dumps(combined),
+        input_file_type=InputFileType.JsonSchema,
+        output=PY_OUTPUT,
+        output_model_type=DataModelType.PydanticV2BaseModel,
+        use_standard_collections=True,
+        use_union_operator=True,
+        target_python_version=PythonVersion.PY_311,
+    )
 
     print(f"  → {PY_OUTPUT}")
 
@@ -190,8 +210,10 @@ def main():
     print(f"Source: {SCHEMA_DIR}/*.schema.json")
     print()
 
-    generate_typescript()
-    generate_python()
+    schemas = load_schemas()
+
+    generate_typescript(schemas)
+    generate_python(schemas)
 
     print()
     print("Done!")
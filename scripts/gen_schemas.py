@@ -10,11 +10,11 @@ This is the SINGLE SOURCE OF TRUTH for types.
 Python uses Pydantic directly, TypeScript gets generated types.
 """
 
+import functools
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import get_type_hints, get_origin, get_args, Union, Literal
-import inspect
 
 # Add shared to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
@@ -22,8 +22,33 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
 from pydantic import BaseModel
 
 
+# Basic Python -> TypeScript type mapping (module-level so it isn't
+# rebuilt on every conversion call)
+_TYPE_MAP = {
+    str: "string",
+    int: "number",
+    float: "number",
+    bool: "boolean",
+    datetime: "string",  # ISO format
+    bytes: "string",  # base64
+}
+
+_STR_TYPE_MAP = {
+    "str": "string",
+    "int": "number",
+    "float": "number",
+    "bool": "boolean",
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def python_type_to_ts(py_type, indent: int = 0) -> str:
-    """Convert Python type to TypeScript type."""
+    """
+    Convert Python type to TypeScript type.
+
+    Cached on the annotation object - models sharing sub-types (e.g.
+    ChatResponse referencing Message) resolve each type tree once.
+    """
     if py_type is None or py_type is type(None):
         return "null"
 
@@ -54,38 +79,23 @@ def python_type_to_ts(py_type, indent: int = 0) -> str:
         return f"Record<{key}, {val}>"
 
     # Basic types
-    type_map = {
-        str: "string",
-        int: "number",
-        float: "number",
-        bool: "boolean",
-        datetime: "string",  # ISO format
-        bytes: "string",  # base64
-    }
-
-    if py_type in type_map:
-        return type_map[py_type]
+    if py_type in _TYPE_MAP:
+        return _TYPE_MAP[py_type]
 
     # Handle string type names
     if isinstance(py_type, str):
-        return {
-            "str": "string",
-            "int": "number",
-            "float": "number",
-            "bool": "boolean",
-        }.get(py_type, "unknown")
+        return _STR_TYPE_MAP.get(py_type, "unknown")
 
     # Check if it's a Pydantic model
-    if inspect.isclass(py_type) and issubclass(py_type, BaseModel):
+    if isinstance(py_type, type) and issubclass(py_type, BaseModel):
         return py_type.__name__
 
     return "unknown"
 
 
-def pydantic_to_typescript(model: type[BaseModel]) -> str:
-    """Convert a Pydantic model to TypeScript interface."""
-    lines = []
-    lines.append(f"export interface {model.__name__} {{")
+def pydantic_to_typescript(model: type[BaseModel]):
+    """Yield TypeScript interface lines for a Pydantic model."""
+    yield f"export interface {model.__name__} {{"
 
     # Get field info
     for name, field in model.model_fields.items():
@@ -95,12 +105,11 @@ def pydantic_to_typescript(model: type[BaseModel]) -> str:
         # Add description as comment
         desc = field.description
         if desc:
-            lines.append(f"  /** {desc} */")
+            yield f"  /** {desc} */"
 
-        lines.append(f"  {name}{optional}: {ts_type};")
+        yield f"  {name}{optional}: {ts_type};"
 
-    lines.append("}")
-    return "\n".join(lines)
+    yield "}"
 
 
 def generate_typescript() -> str:
@@ -108,10 +117,12 @@ def generate_typescript() -> str:
     # Import all schemas
     from schemas import chat, media, common
 
+    now = datetime.now().isoformat()
+
     lines = [
         "/**",
         " * Auto-generated TypeScript types from Pydantic schemas.",
-        f" * Generated: {datetime.now().isoformat()}",
+        f" * Generated: {now}",
         " * DO NOT EDIT MANUALLY - run `pnpm gen:schemas` to regenerate.",
         " */",
         "",
@@ -122,11 +133,11 @@ def generate_typescript() -> str:
     ]
 
     # Chat types
-    lines.append(pydantic_to_typescript(chat.Message))
+    lines.extend(pydantic_to_typescript(chat.Message))
     lines.append("")
-    lines.append(pydantic_to_typescript(chat.ChatPayload))
+    lines.extend(pydantic_to_typescript(chat.ChatPayload))
     lines.append("")
-    lines.append(pydantic_to_typescript(chat.ChatResponse))
+    lines.extend(pydantic_to_typescript(chat.ChatResponse))
     lines.append("")
 
     lines.extend([
@@ -137,17 +148,17 @@ def generate_typescript() -> str:
     ])
 
     # Media types
-    lines.append(pydantic_to_typescript(media.ImageRef))
+    lines.extend(pydantic_to_typescript(media.ImageRef))
     lines.append("")
-    lines.append(pydantic_to_typescript(media.VideoRef))
+    lines.extend(pydantic_to_typescript(media.VideoRef))
     lines.append("")
-    lines.append(pydantic_to_typescript(media.AudioRef))
+    lines.extend(pydantic_to_typescript(media.AudioRef))
     lines.append("")
-    lines.append(pydantic_to_typescript(media.VisionPayload))
+    lines.extend(pydantic_to_typescript(media.VisionPayload))
     lines.append("")
-    lines.append(pydantic_to_typescript(media.VideoPayload))
+    lines.extend(pydantic_to_typescript(media.VideoPayload))
     lines.append("")
-    lines.append(pydantic_to_typescript(media.TranscriptionPayload))
+    lines.extend(pydantic_to_typescript(media.TranscriptionPayload))
     lines.append("")
 
     lines.extend([
@@ -158,9 +169,9 @@ def generate_typescript() -> str:
     ])
 
     # Common types
-    lines.append(pydantic_to_typescript(common.TaskError))
+    lines.extend(pydantic_to_typescript(common.TaskError))
     lines.append("")
-    lines.append(pydantic_to_typescript(common.TaskLog))
+    lines.extend(pydantic_to_typescript(common.TaskLog))
     lines.append("")
 
     # Add utility types
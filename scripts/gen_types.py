@@ -7,20 +7,55 @@ Usage:
     pnpm gen:types
 """
 
+import functools
+import hashlib
+import io
+import json
 import sys
 import inspect
 import re
+from operator import attrgetter
 from pathlib import Path
 from typing import get_type_hints, Optional, Union, Generator
 from datetime import datetime
 
+# Project paths, resolved once
+_ROOT = Path(__file__).resolve().parent.parent
+_SHARED = _ROOT / "shared"
+_OUT = _ROOT / "packages/core/src/types/generated.ts"
+
 # Add shared to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
+sys.path.insert(0, str(_SHARED))
 
-from tasks.decorator import list_tasks, CATEGORIES, clear_registry
+from tasks.decorator import list_tasks, clear_registry, get_tag_index
 from tasks.discovery import discover_tasks, reset_discovery
 
 
+# Single-scan dispatch for container types - one compiled alternation
+# replaces a chain of substring checks per conversion call
+_TYPE_DISPATCH = re.compile(
+    r"Optional\[(?P<opt>.+)\]"
+    r"|Union\[(?P<uni>.+)\]"
+    r"|list\[(?P<lst>.+)\]"
+    r"|dict\[(?P<dct_k>.+),\s*(?P<dct_v>.+)\]"
+    r"|(?P<gen>Generator)"
+)
+
+# Exact-match basic type mapping (single dict hash, no substring scan)
+_BASIC_MAP = {
+    "str": "string",
+    "int": "number",
+    "float": "number",
+    "bool": "boolean",
+    "None": "null",
+    "NoneType": "null",
+    "dict": "Record<string, unknown>",
+    "list": "unknown[]",
+    "Any": "unknown",
+}
+
+
+@functools.lru_cache(maxsize=1024)
 def python_type_to_typescript(py_type) -> str:
     """Convert Python type annotation to TypeScript type."""
     if py_type is None or py_type is type(None):
@@ -32,67 +67,58 @@ def python_type_to_typescript(py_type) -> str:
     else:
         py_type_str = str(py_type)
 
-    # Basic type mappings
-    type_map = {
-        "str": "string",
-        "int": "number",
-        "float": "number",
-        "bool": "boolean",
-        "None": "null",
-        "NoneType": "null",
-        "dict": "Record<string, unknown>",
-        "list": "unknown[]",
-        "Any": "unknown",
-    }
-
-    # Check for Optional
-    if "Optional[" in py_type_str:
-        inner = re.search(r"Optional\[(.+)\]", py_type_str)
-        if inner:
-            return f"{python_type_to_typescript(inner.group(1))} | null"
-
-    # Check for Union
-    if "Union[" in py_type_str:
-        inner = re.search(r"Union\[(.+)\]", py_type_str)
-        if inner:
-            types = [t.strip() for t in inner.group(1).split(",")]
+    py_type_str = py_type_str.strip()
+
+    # Normalize repr forms like "<class 'str'>" and quoted forward refs
+    if py_type_str.startswith("<class '") and py_type_str.endswith("'>"):
+        py_type_str = py_type_str[8:-2]
+    py_type_str = py_type_str.strip("'\"")
+
+    # Short-circuit the common scalar types (exact lookup; the old
+    # substring scan mapped any name containing "None" etc. wrongly)
+    basic = _BASIC_MAP.get(py_type_str) or _BASIC_MAP.get(
+        py_type_str.removeprefix("typing.")
+    )
+    if basic is not None:
+        return basic
+
+    # One scan dispatches all container forms
+    match = _TYPE_DISPATCH.search(py_type_str)
+    if match:
+        group = match.lastgroup
+        if group == "opt":
+            return f"{python_type_to_typescript(match.group('opt'))} | null"
+        if group == "uni":
+            types = [t.strip() for t in match.group("uni").split(",")]
             return " | ".join(python_type_to_typescript(t) for t in types)
-
-    # Check for list[X]
-    if "list[" in py_type_str:
-        inner = re.search(r"list\[(.+)\]", py_type_str)
-        if inner:
-            return f"{python_type_to_typescript(inner.group(1))}[]"
-
-    # Check for dict[X, Y]
-    if "dict[" in py_type_str:
-        inner = re.search(r"dict\[(.+),\s*(.+)\]", py_type_str)
-        if inner:
-            key_type = python_type_to_typescript(inner.group(1))
-            val_type = python_type_to_typescript(inner.group(2))
+        if group == "lst":
+            return f"{python_type_to_typescript(match.group('lst'))}[]"
+        if group == "dct_v":
+            key_type = python_type_to_typescript(match.group("dct_k"))
+            val_type = python_type_to_typescript(match.group("dct_v"))
             return f"Record<{key_type}, {val_type}>"
+        if group == "gen":
+            return "AsyncGenerator<unknown>"
 
-    # Check for Generator
-    if "Generator" in py_type_str:
-        return "AsyncGenerator<unknown>"
+    return "unknown"
 
-    # Direct mapping
-    for py, ts in type_map.items():
-        if py in py_type_str:
-            return ts
 
-    return "unknown"
+@functools.lru_cache(maxsize=None)
+def _type_hints(func) -> dict:
+    """Resolve a function's type hints once (forward-ref eval is costly)."""
+    try:
+        return get_type_hints(func)
+    except Exception:
+        return {}
 
 
+@functools.lru_cache(maxsize=None)
 def get_function_params(func) -> list[dict]:
-    """Extract parameter info from function signature."""
+    """Extract parameter info from function signature (cached per function)."""
     params = []
     sig = inspect.signature(func)
 
-    try:
-        hints = get_type_hints(func)
-    except Exception:
-        hints = {}
+    hints = _type_hints(func)
 
     for name, param in sig.parameters.items():
         if name in ("self", "cls"):
@@ -117,91 +143,91 @@ def get_function_params(func) -> list[dict]:
     return params
 
 
-def generate_typescript() -> str:
-    """Generate TypeScript types from registered tasks."""
-    tasks = list_tasks()
-
-    # Sort tasks by name
-    tasks = sorted(tasks, key=lambda t: t.name)
-
-    lines = [
-        "/**",
-        " * Auto-generated TypeScript types from Python task decorators.",
-        f" * Generated: {datetime.now().isoformat()}",
-        " * DO NOT EDIT MANUALLY - run `pnpm gen:types` to regenerate.",
-        " */",
-        "",
-        "// =============================================================================",
-        "// Task Names",
-        "// =============================================================================",
-        "",
-    ]
-
-    # TaskName union type
-    task_names = [f'  | "{t.name}"' for t in tasks]
-    lines.append("export type TaskName =")
-    lines.extend(task_names)
-    lines.append(";")
-    lines.append("")
+_RULE = "// ============================================================================="
+
+_TIMESTAMP_RE = re.compile(r"\n \* Generated: .+\n")
+
+
+def _content_digest(content: str) -> bytes:
+    """Digest generated content with the timestamp line ignored."""
+    stripped = _TIMESTAMP_RE.sub("\n", content)
+    return hashlib.blake2b(stripped.encode(), digest_size=16).digest()
+
+
+def _section(title: str) -> str:
+    """Build a section header block."""
+    return f"{_RULE}\n// {title}\n{_RULE}\n\n"
+
+
+def generate_typescript(file=None) -> str:
+    """
+    Generate TypeScript types from registered tasks.
+
+    Streams output into a writer instead of accumulating thousands of
+    list entries; pass `file` (any object with .write) to write directly,
+    otherwise the content is returned from an internal buffer.
+    """
+    # attrgetter extracts the sort key in C, no per-element lambda frame
+    tasks = sorted(list_tasks(), key=attrgetter("name"))
+
+    buf = file if file is not None else io.StringIO()
+    w = buf.write
+
+    w(
+        "/**\n"
+        " * Auto-generated TypeScript types from Python task decorators.\n"
+        f" * Generated: {datetime.now().isoformat()}\n"
+        " * DO NOT EDIT MANUALLY - run `pnpm gen:types` to regenerate.\n"
+        " */\n"
+        "\n"
+    )
 
     # =============================================================================
-    # Category namespace
+    # Task names
     # =============================================================================
-    lines.extend([
-        "// =============================================================================",
-        "// Categories",
-        "// =============================================================================",
-        "",
-        "export namespace Category {",
-    ])
-
-    for category in CATEGORIES:
-        cat_tasks = [t for t in tasks if t.category == category]
-        if cat_tasks:
-            type_name = category.capitalize()
-            task_union = " | ".join(f'"{t.name}"' for t in cat_tasks)
-            lines.append(f"  export type {type_name} = {task_union};")
-
-    lines.append("}")
-    lines.append("")
+    w(_section("Task Names"))
+    w(
+        "export type TaskName =\n  | "
+        + "\n  | ".join(f'"{t.name}"' for t in tasks)
+        + "\n;\n\n"
+    )
 
     # =============================================================================
-    # Capabilities namespace
+    # Category namespace (first segment of the task name)
     # =============================================================================
-    lines.extend([
-        "// =============================================================================",
-        "// Capabilities",
-        "// =============================================================================",
-        "",
-        "export namespace Capability {",
-    ])
-
-    # Collect all capabilities
-    cap_to_tasks: dict[str, list[str]] = {}
+    w(_section("Categories"))
+    w("export namespace Category {\n")
+
+    by_category: dict[str, list] = {}
     for t in tasks:
-        for cap in t.capabilities:
-            if cap not in cap_to_tasks:
-                cap_to_tasks[cap] = []
-            cap_to_tasks[cap].append(t.name)
+        by_category.setdefault(t.name.partition(".")[0], []).append(t)
+
+    for category, cat_tasks in sorted(by_category.items()):
+        type_name = category.capitalize()
+        task_union = " | ".join(f'"{t.name}"' for t in cat_tasks)
+        w(f"  export type {type_name} = {task_union};\n")
+
+    w("}\n\n")
+
+    # =============================================================================
+    # Tag namespace
+    # =============================================================================
+    w(_section("Tags"))
+    w("export namespace Tag {\n")
 
-    for cap in sorted(cap_to_tasks.keys()):
-        type_name = cap.replace("-", "").replace("_", "").capitalize()
-        task_union = " | ".join(f'"{n}"' for n in cap_to_tasks[cap])
-        lines.append(f"  export type {type_name} = {task_union};")
+    # The registry maintains the inverse index; sort for stable output
+    for tag, tag_tasks in sorted(get_tag_index().items()):
+        type_name = tag.replace("-", "").replace("_", "").capitalize()
+        task_union = " | ".join(sorted(f'"{t.name}"' for t in tag_tasks))
+        w(f"  export type {type_name} = {task_union};\n")
 
-    lines.append("}")
-    lines.append("")
+    w("}\n\n")
 
     # =============================================================================
-    # Task Payloads
+    # Task payloads
     # =============================================================================
-    lines.extend([
-        "// =============================================================================",
-        "// Task Payloads (input parameters)",
-        "// =============================================================================",
-        "",
-        "export interface TaskPayloads {",
-    ])
+    w(_section("Task Payloads (input parameters)"))
+    w("export interface TaskPayloads {\n")
 
     for t in tasks:
         try:
@@ -210,88 +236,78 @@ def generate_typescript() -> str:
             params = []
 
         if params:
-            lines.append(f'  "{t.name}": {{')
-            for p in params:
-                optional = "?" if not p["required"] else ""
-                lines.append(f'    {p["name"]}{optional}: {p["type"]};')
-            lines.append("  };")
+            w(f'  "{t.name}": {{\n')
+            w(
+                "\n".join(
+                    f'    {p["name"]}{"" if p["required"] else "?"}: {p["type"]};'
+                    for p in params
+                )
+            )
+            w("\n  };\n")
         else:
-            lines.append(f'  "{t.name}": Record<string, unknown>;')
+            w(f'  "{t.name}": Record<string, unknown>;\n')
 
-    lines.append("}")
-    lines.append("")
+    w("}\n\n")
 
     # =============================================================================
-    # Task Metadata
+    # Task metadata
     # =============================================================================
-    lines.extend([
-        "// =============================================================================",
-        "// Task Metadata",
-        "// =============================================================================",
-        "",
-        "export interface TaskMetadata {",
-        "  name: string;",
-        "  category: string;",
-        "  capabilities: string[];",
-        "  gpu: string | null;",
-        "  timeout: number;",
-        "  streaming: boolean;",
-        "  description: string;",
-        "}",
-        "",
-        "export const TASK_METADATA: Record<TaskName, TaskMetadata> = {",
-    ])
+    w(_section("Task Metadata"))
+    w(
+        "export interface TaskMetadata {\n"
+        "  name: string;\n"
+        "  category: string;\n"
+        "  tags: string[];\n"
+        "  gpu: string | null;\n"
+        "  timeout: number;\n"
+        "  streaming: boolean;\n"
+        "  description: string;\n"
+        "}\n"
+        "\n"
+        "export const TASK_METADATA: Record<TaskName, TaskMetadata> = {\n"
+    )
 
     for t in tasks:
-        gpu_str = f'"{t.gpu}"' if t.gpu else "null"
-        caps_str = ", ".join(f'"{c}"' for c in t.capabilities)
-        desc = t.description.replace('"', '\\"')
-
-        lines.extend([
-            f'  "{t.name}": {{',
-            f'    name: "{t.name}",',
-            f'    category: "{t.category}",',
-            f'    capabilities: [{caps_str}],',
-            f'    gpu: {gpu_str},',
-            f'    timeout: {t.timeout},',
-            f'    streaming: {"true" if t.streaming else "false"},',
-            f'    description: "{desc}",',
-            '  },',
-        ])
-
-    lines.append("};")
-    lines.append("")
+        # json.dumps produces fully-escaped, JS-compatible string literals
+        # in one C call (quotes, backslashes, newlines, control chars)
+        name = json.dumps(t.name)
+        category = json.dumps(t.name.partition(".")[0])
+        tags_str = ", ".join(json.dumps(tag) for tag in t.tags)
+        gpu_str = json.dumps(t.gpu) if t.gpu else "null"
+        desc = json.dumps(t.description)
+
+        w(
+            f"  {name}: {{\n"
+            f"    name: {name},\n"
+            f"    category: {category},\n"
+            f"    tags: [{tags_str}],\n"
+            f"    gpu: {gpu_str},\n"
+            f"    timeout: {t.timeout},\n"
+            f'    streaming: {"true" if t.streaming else "false"},\n'
+            f"    description: {desc},\n"
+            "  },\n"
+        )
+
+    w("};\n\n")
 
     # =============================================================================
     # Utility types
     # =============================================================================
-    lines.extend([
-        "// =============================================================================",
-        "// Utility Types",
-        "// =============================================================================",
-        "",
-        "/** Get payload type for a specific task */",
-        "export type PayloadFor<T extends TaskName> = TaskPayloads[T];",
-        "",
-        "/** Tasks requiring GPU */",
-    ])
-
-    gpu_tasks = [t.name for t in tasks if t.gpu]
-    if gpu_tasks:
-        lines.append(f"export type GpuTask = {' | '.join(f'\"{n}\"' for n in gpu_tasks)};")
-    else:
-        lines.append("export type GpuTask = never;")
-    lines.append("")
+    w(_section("Utility Types"))
+    w(
+        "/** Get payload type for a specific task */\n"
+        "export type PayloadFor<T extends TaskName> = TaskPayloads[T];\n"
+        "\n"
+        "/** Tasks requiring GPU */\n"
+    )
 
-    # Streaming tasks
-    streaming_tasks = [t.name for t in tasks if t.streaming]
-    if streaming_tasks:
-        lines.append(f"export type StreamingTask = {' | '.join(f'\"{n}\"' for n in streaming_tasks)};")
-    else:
-        lines.append("export type StreamingTask = never;")
-    lines.append("")
+    gpu_union = " | ".join(f'"{t.name}"' for t in tasks if t.gpu)
+    w(f"export type GpuTask = {gpu_union or 'never'};\n\n")
 
-    return "\n".join(lines)
+    streaming_union = " | ".join(f'"{t.name}"' for t in tasks if t.streaming)
+    w(f"export type StreamingTask = {streaming_union or 'never'};\n\n")
+
+    return buf.getvalue() if file is None else ""
 
 
 def main():
@@ -306,12 +322,20 @@ def main():
     # Generate TypeScript
     ts_content = generate_typescript()
 
-    # Write to file
-    output_path = Path(__file__).parent.parent / "packages/core/src/types/generated.ts"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(ts_content)
+    # Skip the write when only the timestamp changed - rewriting the file
+    # needlessly invalidates downstream tsc/vite caches
+    try:
+        if _content_digest(_OUT.read_text()) == _content_digest(ts_content):
+            print(f"Unchanged, skipping write: {_OUT}")
+            print(f"Total tasks: {len(list_tasks())}")
+            return
+    except FileNotFoundError:
+        pass
+
+    _OUT.parent.mkdir(parents=True, exist_ok=True)
+    _OUT.write_text(ts_content)
 
-    print(f"Generated: {output_path}")
+    print(f"Generated: {_OUT}")
     print(f"Total tasks: {len(list_tasks())}")
 
 
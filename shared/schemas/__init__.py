@@ -3,22 +3,40 @@ Shared schemas - Single source of truth for Python AND TypeScript.
 
 These Pydantic models define the contract between frontend and backend.
 TypeScript types are auto-generated from these.
-"""
 
-from .chat import Message, ChatPayload, ChatResponse
-from .media import ImageRef, VideoRef, AudioRef
-from .common import TaskResult, TaskError
+Submodules load lazily (PEP 562) - Pydantic compiles validators at
+class-definition time, so consumers that never touch a schema (the
+decorator, discovery) skip that cost entirely.
+"""
 
-__all__ = [
+_EXPORTS = {
     # Chat
-    "Message",
-    "ChatPayload",
-    "ChatResponse",
+    "Message": "chat",
+    "ChatPayload": "chat",
+    "ChatResponse": "chat",
     # Media references (never raw data!)
-    "ImageRef",
-    "VideoRef",
-    "AudioRef",
+    "ImageRef": "media",
+    "VideoRef": "media",
+    "AudioRef": "media",
     # Common
-    "TaskResult",
-    "TaskError",
-]
+    "TaskResult": "common",
+    "TaskError": "common",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so the next access skips __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
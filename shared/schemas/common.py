@@ -2,6 +2,7 @@
 Common schemas for all tasks.
 """
 
+from functools import cache
 from typing import Any, Optional, Generic, TypeVar
 from datetime import datetime
 from pydantic import BaseModel, Field
@@ -26,7 +27,8 @@ class TaskResult(BaseModel, Generic[T]):
     error: Optional[str] = None
 
     # Metadata
-    task_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    # uuid4().hex skips the hyphen-formatting str() path
+    task_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     task_name: str
     started_at: datetime
     completed_at: datetime
@@ -35,6 +37,23 @@ class TaskResult(BaseModel, Generic[T]):
     # Spårning
     trace_id: Optional[str] = None  # För att följa request genom systemet
 
+    @classmethod
+    def build_trusted(cls, **kwargs) -> "TaskResult":
+        """
+        Construct without validation for trusted internal producers.
+
+        The executor has already validated the task output; re-validating
+        the wrapper per task pays Pydantic's field dispatch for nothing.
+        Only use with server-internal data.
+        """
+        return cls.model_construct(**kwargs)
+
+
+@cache
+def task_result_json_schema() -> dict:
+    """JSON Schema for TaskResult, built once per process."""
+    return TaskResult.model_json_schema()
+
 
 class TaskError(BaseModel):
     """Structured error information."""
@@ -61,7 +80,7 @@ class TaskLog(BaseModel):
     - Billing
     """
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     task_name: str
     payload_hash: str  # SHA256 av input (för deduplication)
 
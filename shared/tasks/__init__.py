@@ -26,6 +26,7 @@ from .decorator import (
     task,
     get_task,
     list_tasks,
+    freeze_registry,
     filter_by_tag,
     filter_by_tags,
     list_gpu_tasks,
@@ -38,6 +39,7 @@ __all__ = [
     "task",
     "get_task",
     "list_tasks",
+    "freeze_registry",
     "filter_by_tag",
     "filter_by_tags",
     "list_gpu_tasks",
@@ -9,6 +9,23 @@ import os
 from ..decorator import task
 
 
+# Shared HTTP session - keep-alive skips the ~100-300 ms TLS handshake
+# that a fresh connection pays on every synth call
+_session = None
+
+
+def _get_session():
+    """Get or create the pooled requests session."""
+    global _session
+
+    if _session is None:
+        import requests
+
+        _session = requests.Session()
+
+    return _session
+
+
 @task(
     name="elevenlabs.synthesize",
     tags=["audio", "text", "ai", "generate", "tts"],
@@ -24,7 +41,6 @@ def synthesize(
     output_path: Optional[str] = None,
 ) -> str:
     """Synthesize speech using ElevenLabs."""
-    import requests
     import time
 
     api_key = os.environ.get("ELEVENLABS_API_KEY")
@@ -34,7 +50,8 @@ def synthesize(
     if output_path is None:
         output_path = f"/tmp/tts_elevenlabs_{int(time.time())}.mp3"
 
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+    # The /stream endpoint delivers audio as it is generated
+    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
 
     headers = {
         "Accept": "audio/mpeg",
@@ -51,11 +68,13 @@ def synthesize(
         },
     }
 
-    response = requests.post(url, json=data, headers=headers)
-    response.raise_for_status()
-
-    with open(output_path, "wb") as f:
-        f.write(response.content)
+    # Write chunks as they download - network and disk I/O overlap, and
+    # the full MP3 never sits in memory
+    with _get_session().post(url, json=data, headers=headers, stream=True) as response:
+        response.raise_for_status()
+        with open(output_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=65536):
+                f.write(chunk)
 
     return output_path
 
@@ -72,7 +91,7 @@ def clone_voice(
     description: str = "",
 ) -> str:
     """Clone a voice from audio samples."""
-    import requests
+    import contextlib
 
     api_key = os.environ.get("ELEVENLABS_API_KEY")
     if not api_key:
@@ -81,29 +100,27 @@ def clone_voice(
     url = "https://api.elevenlabs.io/v1/voices/add"
     headers = {"xi-api-key": api_key}
 
-    files = []
-    for path in audio_paths:
-        files.append(("files", open(path, "rb")))
-
     data = {
         "name": name,
         "description": description,
     }
 
-    response = requests.post(url, headers=headers, data=data, files=files)
-    response.raise_for_status()
+    # ExitStack closes every handle even when raise_for_status throws -
+    # the old close-after-raise path leaked an fd per sample on error
+    with contextlib.ExitStack() as stack:
+        files = [
+            ("files", stack.enter_context(open(path, "rb")))
+            for path in audio_paths
+        ]
 
-    # Close file handles
-    for _, f in files:
-        f.close()
+        response = _get_session().post(url, headers=headers, data=data, files=files)
+        response.raise_for_status()
 
     return response.json()["voice_id"]
 
 
 def list_voices() -> list[dict]:
     """List available ElevenLabs voices."""
-    import requests
-
     api_key = os.environ.get("ELEVENLABS_API_KEY")
     if not api_key:
         raise ValueError("ELEVENLABS_API_KEY environment variable not set")
@@ -111,7 +128,7 @@ def list_voices() -> list[dict]:
     url = "https://api.elevenlabs.io/v1/voices"
     headers = {"xi-api-key": api_key}
 
-    response = requests.get(url, headers=headers)
+    response = _get_session().get(url, headers=headers)
     response.raise_for_status()
 
     data = response.json()
@@ -135,6 +152,31 @@ from typing import Optional
 from ..decorator import task
 
 
+# Persistent OpenAI client over a pooled (HTTP/2 when available)
+# transport, so repeated synth calls reuse one connection
+_client = None
+
+
+def _get_client():
+    """Get or create the shared OpenAI client."""
+    global _client
+
+    if _client is None:
+        import httpx
+        import openai
+
+        limits = httpx.Limits(max_keepalive_connections=16)
+        try:
+            http_client = httpx.Client(http2=True, limits=limits)
+        except ImportError:
+            # h2 not installed - plain HTTP/1.1 keep-alive still pools
+            http_client = httpx.Client(limits=limits)
+
+        _client = openai.OpenAI(http_client=http_client)
+
+    return _client
+
+
 @task(
     name="openai.tts",
     tags=["audio", "text", "ai", "generate", "tts"],
@@ -149,13 +191,12 @@ def synthesize(
     output_path: Optional[str] = None,
 ) -> str:
     """Synthesize speech using OpenAI TTS."""
-    import openai
     import time
 
     if output_path is None:
         output_path = f"/tmp/tts_openai_{int(time.time())}.mp3"
 
-    response = openai.audio.speech.create(
+    response = _get_client().audio.speech.create(
         model=model,
         voice=voice,
         input=text,
@@ -219,9 +260,10 @@ def _get_model(model_type: str = "multilingual", device: str = "cuda"):
 
     if _model is None or _model_type != model_type:
         if _model is not None:
+            # Dropping the reference is enough - the caching allocator
+            # reuses the freed blocks, and empty_cache() is a full
+            # allocator scan that stalls the model swap
             del _model
-            import torch
-            torch.cuda.empty_cache()
 
         from chatterbox.tts import ChatterboxTTS
 
@@ -230,6 +272,26 @@ def _get_model(model_type: str = "multilingual", device: str = "cuda"):
         else:
             _model = ChatterboxTTS.from_pretrained("chatterbox-multilingual", device=device)
 
+        # Compile the transformer backbone once at load time; the
+        # autoregressive decode repeats the same step shapes, which is
+        # what reduce-overhead (CUDA-graph-backed) is built for
+        if device == "cuda" and hasattr(_model, "t3"):
+            import torch
+
+            try:
+                # reduce-overhead captures the repeated decode step into
+                # CUDA graphs, eliminating per-step Python + launch cost
+                _model.t3 = torch.compile(
+                    _model.t3, mode="reduce-overhead", fullgraph=False
+                )
+
+                # Warm up once so compile + graph capture happen at load
+                # time (the container enter hook) instead of on the
+                # first user request
+                _model.generate("ok")
+            except Exception:
+                pass  # older torch / unsupported backend - run eager
+
         _model_type = model_type
 
     return _model
@@ -253,6 +315,7 @@ def synthesize(
     output_path: Optional[str] = None,
 ) -> str:
     """Synthesize speech using Chatterbox (local GPU)."""
+    import torch
     import torchaudio
     import time
 
@@ -261,21 +324,23 @@ def synthesize(
 
     model = _get_model(model_type, device)
 
-    if voice_ref:
-        wav = model.generate(
-            text,
-            audio_prompt_path=voice_ref,
-            exaggeration=exaggeration,
-            cfg_weight=cfg_weight,
-            temperature=temperature,
-        )
-    else:
-        wav = model.generate(
-            text,
-            exaggeration=exaggeration,
-            cfg_weight=cfg_weight,
-            temperature=temperature,
-        )
+    # bf16 autocast halves weight traffic in the bandwidth-bound decoder
+    with torch.autocast("cuda", dtype=torch.bfloat16, enabled=device == "cuda"):
+        if voice_ref:
+            wav = model.generate(
+                text,
+                audio_prompt_path=voice_ref,
+                exaggeration=exaggeration,
+                cfg_weight=cfg_weight,
+                temperature=temperature,
+            )
+        else:
+            wav = model.generate(
+                text,
+                exaggeration=exaggeration,
+                cfg_weight=cfg_weight,
+                temperature=temperature,
+            )
 
     torchaudio.save(output_path, wav.unsqueeze(0).cpu(), model.sr)
     return output_path
@@ -316,12 +381,30 @@ def clone_voice(
     output_path: Optional[str] = None,
 ) -> str:
     """Extract voice reference for cloning."""
-    import torchaudio
+    import shutil
+    import subprocess
     import time
 
     if output_path is None:
         output_path = f"/tmp/voice_ref_{int(time.time())}.wav"
 
+    # ffmpeg's C resampler (SIMD) downmixes + resamples in one pass,
+    # far faster than the torchaudio Python path and with no VRAM use
+    if shutil.which("ffmpeg"):
+        subprocess.run(
+            [
+                "ffmpeg", "-y", "-i", audio_path,
+                "-ac", "1", "-ar", "24000", "-acodec", "pcm_s16le",
+                output_path,
+            ],
+            check=True,
+            capture_output=True,
+        )
+        return output_path
+
+    # Fallback when ffmpeg is missing
+    import torchaudio
+
     waveform, sample_rate = torchaudio.load(audio_path)
 
     if sample_rate != 24000:
@@ -361,5 +444,7 @@ def clear_cache():
     _model_type = None
 
     import torch
-    if torch.cuda.is_available():
+    # is_initialized avoids spinning up a CUDA context on gpu0 just to
+    # empty an already-empty cache
+    if torch.cuda.is_initialized():
         torch.cuda.empty_cache()
@@ -13,15 +13,39 @@ Usage:
         ...
 """
 
+import functools
+import sys
+import threading
+from types import MappingProxyType
 from typing import Callable, Optional, Any, Union, Type
-from functools import wraps
 
 from .types import TaskMeta, ChunkConfig
 
 
-# Global task registry
+# Global task registry (includes alias entries)
 _TASK_REGISTRY: dict[str, TaskMeta] = {}
 
+# Canonical tasks only (one entry per task, no aliases) - maintained at
+# registration so list_tasks needs no per-call dedup pass
+_UNIQUE_TASKS: dict[str, TaskMeta] = {}
+
+# Inverse tag -> tasks index, also maintained at registration, so tag
+# queries are a dict hit instead of a full registry scan
+_TAG_INDEX: dict[str, list[TaskMeta]] = {}
+
+# Pre-serialized export_schemas blob; invalidated on (re)registration
+_EXPORTED_BLOB: Optional[bytes] = None
+
+# Positional id table - routers resolve a name to an id once per
+# connection, then dispatch by C-level list index instead of a string
+# hash per message
+_TASKS_BY_ID: list[TaskMeta] = []
+
+# Discovery imports task modules on a thread pool, so registration (a
+# multi-structure update including the id read-modify-write) must be
+# serialized
+_REGISTRY_LOCK = threading.Lock()
+
 
 # Standard tags for consistency
 STANDARD_TAGS = {
@@ -39,12 +63,15 @@ STANDARD_TAGS = {
 def task(
     name: str,
     tags: list[str] = None,
+    aliases: list[str] = None,
     gpu: Optional[str] = None,
     timeout: int = 300,
     streaming: bool = False,
     chunk: Optional[Union[dict, ChunkConfig]] = None,
     input: Optional[Type] = None,
     output: Optional[Type] = None,
+    trust_output: bool = False,
+    batch: bool = False,
 ) -> Callable:
     """
     Decorator to register a task function.
@@ -52,12 +79,17 @@ def task(
     Args:
         name: Task name (e.g., 'audio.transcribe')
         tags: List of tags (e.g., ['audio', 'text', 'ai', 'gpu'])
+        aliases: Alternate names resolving to this task (e.g., legacy names)
         gpu: GPU type required (None, 'T4', 'A10G', 'A100')
         timeout: Task timeout in seconds
         streaming: Whether this task yields results incrementally
         chunk: Chunking configuration for long-running tasks
         input: Optional Pydantic model for input validation
         output: Optional Pydantic model for output validation
+        trust_output: Skip output validation via model_construct - only
+            for handlers whose output shape our own code controls
+        batch: Function accepts a whole batch (list) in one call
+            (used by execute_many)
 
     Returns:
         Decorated function with _task_meta attribute
@@ -81,6 +113,7 @@ def task(
             ...
     """
     tags = tags or []
+    aliases = aliases or []
 
     # Auto-add gpu tag if gpu is specified
     if gpu and "gpu" not in tags:
@@ -104,18 +137,22 @@ def task(
             chunk_config = chunk
 
     def decorator(func: Callable) -> Callable:
-        # Extract description from docstring
+        global _EXPORTED_BLOB
+        # Extract description from docstring: find + slice copies only
+        # the first line (partition would also copy the tail); intern so
+        # repeated exports share one string object
         description = ""
         if func.__doc__:
-            # Get first line of docstring
-            lines = func.__doc__.strip().split("\n")
-            description = lines[0].strip()
+            doc = func.__doc__.strip()
+            newline = doc.find("\n")
+            description = sys.intern((doc if newline < 0 else doc[:newline]).strip())
 
         # Create metadata
         meta = TaskMeta(
             name=name,
             func=func,
             tags=tags,
+            aliases=aliases,
             gpu=gpu,
             timeout=timeout,
             streaming=streaming,
@@ -123,18 +160,58 @@ def task(
             description=description,
             input_schema=input,
             output_schema=output,
+            trust_output=trust_output,
+            batch=batch,
         )
 
-        # Register task
-        _TASK_REGISTRY[name] = meta
-
-        # Attach metadata to function
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-
-        wrapper._task_meta = meta
-        return wrapper
+        # Register under the lock - discovery imports modules on a
+        # thread pool, and the id assignment and purge span multiple
+        # structures
+        with _REGISTRY_LOCK:
+            # Register task under its canonical name and every alias, so
+            # get_task resolves both with a single dict lookup
+            _TASK_REGISTRY[name] = meta
+            for alias in aliases:
+                _TASK_REGISTRY[alias] = meta
+            # Purge any previous registration of the same name so the tag
+            # index, id table and alias keys never hold stale metas
+            previous = _UNIQUE_TASKS.get(name)
+            if previous is not None:
+                for tag_metas in _TAG_INDEX.values():
+                    if previous in tag_metas:
+                        tag_metas.remove(previous)
+                for alias in previous.aliases:
+                    if _TASK_REGISTRY.get(alias) is previous:
+                        del _TASK_REGISTRY[alias]
+                meta.id = previous.id
+                _TASKS_BY_ID[previous.id] = meta
+            else:
+                meta.id = len(_TASKS_BY_ID)
+                _TASKS_BY_ID.append(meta)
+
+            _UNIQUE_TASKS[name] = meta
+            for tag in tags:
+                _TAG_INDEX.setdefault(tag, []).append(meta)
+            _EXPORTED_BLOB = None
+            get_task.cache_clear()
+
+        # Attach metadata to the original function and return it as-is -
+        # a pass-through wrapper would add a Python frame to every call
+        try:
+            func._task_meta = meta
+        except (AttributeError, TypeError):
+            # builtins/C functions reject attribute assignment - fall
+            # back to a minimal wrapper for those only
+            from functools import wraps
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            wrapper._task_meta = meta
+            return wrapper
+
+        return func
 
     return decorator
 
@@ -144,19 +221,51 @@ def get_registry() -> dict[str, TaskMeta]:
     return _TASK_REGISTRY
 
 
+def freeze_registry() -> None:
+    """
+    Freeze the registry once startup imports are done.
+
+    Interns every key and wraps the registries in MappingProxyType, so
+    hot get_task lookups resolve via cached-hash pointer comparison and
+    accidental post-startup registration fails loudly. clear_registry
+    thaws back to plain dicts (for tests)."""
+    global _TASK_REGISTRY, _UNIQUE_TASKS
+
+    _TASK_REGISTRY = MappingProxyType(
+        {sys.intern(name): meta for name, meta in _TASK_REGISTRY.items()}
+    )
+    _UNIQUE_TASKS = MappingProxyType(
+        {sys.intern(name): meta for name, meta in _UNIQUE_TASKS.items()}
+    )
+
+
+@functools.lru_cache(maxsize=256)
 def get_task(name: str) -> Optional[TaskMeta]:
-    """Get a task by name."""
+    """Get a task by name or alias (cached for hot dispatch names)."""
+    # No sys.intern here: interned strings are immortal, and this sees
+    # arbitrary caller-supplied names. Registry keys are interned at
+    # freeze time; plain hash equality resolves them fine.
     return _TASK_REGISTRY.get(name)
 
 
+def get_task_by_id(task_id: int) -> TaskMeta:
+    """Get a task by its positional id (see TaskMeta.id)."""
+    return _TASKS_BY_ID[task_id]
+
+
 def list_tasks() -> list[TaskMeta]:
-    """List all registered tasks."""
-    return list(_TASK_REGISTRY.values())
+    """List all registered tasks (each task once, aliases excluded)."""
+    return list(_UNIQUE_TASKS.values())
+
+
+def get_tag_index() -> dict[str, list[TaskMeta]]:
+    """Get the tag -> tasks index."""
+    return _TAG_INDEX
 
 
 def filter_by_tag(tag: str) -> list[TaskMeta]:
     """List all tasks with a specific tag."""
-    return [t for t in list_tasks() if t.has_tag(tag)]
+    return list(_TAG_INDEX.get(tag, ()))
 
 
 def filter_by_tags(tags: list[str], match_all: bool = True) -> list[TaskMeta]:
@@ -193,9 +302,52 @@ def list_chunked_tasks() -> list[TaskMeta]:
     return [t for t in list_tasks() if t.is_chunked]
 
 
+def export_schemas() -> list[dict]:
+    """Export every task's metadata dict (per-task dicts are cached)."""
+    metas = list(_UNIQUE_TASKS.values())
+
+    # Pydantic's schema build runs partly in pydantic-core (GIL is
+    # released there); fan out only when the registry is big enough for
+    # the thread overhead to pay off
+    if len(metas) > 32:
+        import os
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            return list(pool.map(TaskMeta.to_dict, metas))
+
+    return [meta.to_dict() for meta in metas]
+
+
+def export_schemas_bytes() -> bytes:
+    """
+    JSON export of every task's metadata, serialized once.
+
+    Endpoints serving /schemas repeatedly can return these bytes without
+    re-walking the registry or re-encoding per request.
+    """
+    global _EXPORTED_BLOB
+
+    if _EXPORTED_BLOB is None:
+        try:
+            import orjson
+            _EXPORTED_BLOB = orjson.dumps(export_schemas())
+        except ImportError:
+            import json
+            _EXPORTED_BLOB = json.dumps(export_schemas()).encode()
+
+    return _EXPORTED_BLOB
+
+
 def clear_registry() -> None:
-    """Clear the task registry (for testing)."""
-    _TASK_REGISTRY.clear()
+    """Clear the task registry (for testing). Also thaws a frozen registry."""
+    global _TASK_REGISTRY, _UNIQUE_TASKS, _EXPORTED_BLOB
+    _TASK_REGISTRY = {}
+    _UNIQUE_TASKS = {}
+    _TAG_INDEX.clear()
+    _TASKS_BY_ID.clear()
+    _EXPORTED_BLOB = None
+    get_task.cache_clear()
 
 
 # Directories to scan for tasks
@@ -7,9 +7,12 @@ Usage:
     ensure_discovered()  # Import all task modules to trigger registration
 """
 
+import functools
 import importlib
-import pkgutil
 import logging
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -20,13 +23,22 @@ logger = logging.getLogger(__name__)
 
 _discovered = False
 
+# Directory-scan cache keyed on mtime - repeated discovery in dev loops
+# (watch-mode generators) skips the readdir when nothing changed
+_SCAN_CACHE: dict[Path, tuple[float, list[str]]] = {}
 
-def discover_tasks(base_path: Optional[Path] = None) -> int:
+
+def discover_tasks(base_path: Optional[Path] = None, parallel: bool = True) -> int:
     """
     Import all task modules to trigger @task decorator registration.
 
+    Imports run on a thread pool so module file I/O overlaps across
+    directories; registration itself is serialized by the decorator's
+    registry lock.
+
     Args:
         base_path: Base path for task modules (defaults to this directory)
+        parallel: Import modules concurrently (disable for debugging)
 
     Returns:
         Number of tasks discovered
@@ -39,31 +51,58 @@ def discover_tasks(base_path: Optional[Path] = None) -> int:
     count_before = len(get_registry())
     errors = []
 
+    # Enumerate all modules first (cheap), then import
+    module_names = []
     for directory in TASK_DIRECTORIES:
         dir_path = base_path / directory
 
-        if not dir_path.exists():
+        # One stat covers both existence and the directory check
+        try:
+            st = dir_path.stat()
+        except FileNotFoundError:
             logger.debug(f"Task directory not found: {directory}")
             continue
 
-        if not dir_path.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             continue
 
-        # Import all modules in directory
-        for module_info in pkgutil.iter_modules([str(dir_path)]):
-            if module_info.name.startswith("_"):
-                continue
-
-            module_name = f"tasks.{directory}.{module_info.name}"
-            try:
-                importlib.import_module(module_name)
-                logger.debug(f"Imported: {module_name}")
-            except ImportError as e:
-                errors.append((module_name, str(e)))
-                logger.warning(f"Failed to import {module_name}: {e}")
-            except Exception as e:
-                errors.append((module_name, str(e)))
-                logger.error(f"Error importing {module_name}: {e}")
+        mtime = st.st_mtime
+
+        cached = _SCAN_CACHE.get(dir_path)
+        if cached is not None and cached[0] == mtime:
+            names = cached[1]
+        else:
+            # Flat directory of .py modules - a scandir with a filename
+            # filter avoids pkgutil's per-entry finder machinery
+            with os.scandir(dir_path) as entries:
+                names = sorted(
+                    entry.name[:-3]
+                    for entry in entries
+                    if entry.is_file(follow_symlinks=False)
+                    and entry.name.endswith(".py")
+                    and not entry.name.startswith("_")
+                )
+            _SCAN_CACHE[dir_path] = (mtime, names)
+
+        module_names.extend(f"tasks.{directory}.{name}" for name in names)
+
+    def _import(module_name: str) -> None:
+        try:
+            importlib.import_module(module_name)
+            logger.debug(f"Imported: {module_name}")
+        except ImportError as e:
+            errors.append((module_name, str(e)))
+            logger.warning(f"Failed to import {module_name}: {e}")
+        except Exception as e:
+            errors.append((module_name, str(e)))
+            logger.error(f"Error importing {module_name}: {e}")
+
+    if parallel and len(module_names) > 1:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(_import, module_names))
+    else:
+        for module_name in module_names:
+            _import(module_name)
 
     _discovered = True
     count_after = len(get_registry())
@@ -74,9 +113,14 @@ def discover_tasks(base_path: Optional[Path] = None) -> int:
     return count_after - count_before
 
 
+@functools.cache
 def ensure_discovered() -> None:
-    """Ensure all tasks have been discovered. Safe to call multiple times."""
-    global _discovered
+    """
+    Ensure all tasks have been discovered.
+
+    Cached so repeat calls from hot paths cost a single dict lookup
+    instead of re-checking discovery state.
+    """
     if not _discovered:
         discover_tasks()
 
@@ -90,3 +134,4 @@ def reset_discovery() -> None:
     """Reset discovery state (for testing)."""
     global _discovered
     _discovered = False
+    ensure_discovered.cache_clear()
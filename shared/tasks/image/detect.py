@@ -3,14 +3,267 @@ YOLO-based detection, segmentation, and pose estimation.
 Uses ultralytics library.
 """
 
-from typing import Optional
+import os
+import threading
+from pathlib import Path
+from typing import Generator, Optional
 
 from ..decorator import task
 
 
+# Persistent weights directory (the backend points this at a mounted
+# volume) - bare weight names resolve here so downloads and exported
+# TRT engines survive container restarts
+_WEIGHTS_DIR = os.environ.get("DWA_WEIGHTS_DIR")
+
+
+def _weights_path(model: str) -> str:
+    """Resolve a bare weights filename into the persistent weights dir."""
+    if _WEIGHTS_DIR and os.sep not in model:
+        os.makedirs(_WEIGHTS_DIR, exist_ok=True)
+        return str(Path(_WEIGHTS_DIR) / model)
+    return model
+
+
+# Global model cache keyed by (model, device) - shared by all tasks in
+# this module, mirroring the chatterbox _get_model pattern
+_model_cache: dict = {}
+
+# Serializes use of the shared pinned/GPU staging buffers (and the
+# cached model they feed) - concurrent callers would silently corrupt
+# each other's frames otherwise
+_gpu_lock = threading.Lock()
+
+
+def _get_yolo(model: str, device: str):
+    """Get or create a YOLO model (weights loaded once per process)."""
+    key = (model, device)
+
+    if key not in _model_cache:
+        from ultralytics import YOLO
+
+        _model_cache[key] = YOLO(_resolve_model(model, device))
+
+    return _model_cache[key]
+
+
+# Preallocated pinned/GPU staging buffers for detect_batch, keyed by
+# imgsz and grown to the largest batch seen - pinned pages make the H2D
+# copy async-capable and reuse avoids per-call allocator churn
+_staging_buffers: dict = {}
+
+
+def _get_staging(batch: int, imgsz: int):
+    """Get (pinned, gpu, copy_stream) staging buffers for a batch."""
+    import torch
+
+    bufs = _staging_buffers.get(imgsz)
+    if bufs is None or bufs[0].shape[0] < batch:
+        shape = (batch, imgsz, imgsz, 3)
+        bufs = (
+            torch.empty(shape, dtype=torch.uint8, pin_memory=True),
+            torch.empty(shape, dtype=torch.uint8, device="cuda"),
+            torch.cuda.Stream(),
+        )
+        _staging_buffers[imgsz] = bufs
+
+    return bufs
+
+
+# Reusable pinned host buffer for per-frame box transfers in track() -
+# long videos otherwise allocate a fresh host array every frame
+_track_buf = None
+
+
+def _to_host_pinned(data):
+    """Copy a CUDA tensor into a reused pinned buffer, return numpy view."""
+    global _track_buf
+
+    import torch
+
+    n, c = data.shape
+    if (
+        _track_buf is None
+        or _track_buf.shape[0] < n
+        or _track_buf.shape[1] != c
+        or _track_buf.dtype != data.dtype
+    ):
+        _track_buf = torch.empty((max(n, 64), c), dtype=data.dtype, pin_memory=True)
+
+    buf = _track_buf[:n]
+    buf.copy_(data)
+    return buf.numpy()
+
+
+def clear_cache():
+    """Clear the model and staging-buffer caches to free VRAM."""
+    global _track_buf
+    _model_cache.clear()
+    _staging_buffers.clear()
+    _track_buf = None
+
+    import torch
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def _boxes_to_detections(r, pinned: bool = False) -> list[dict]:
+    """
+    Convert a result's boxes to detection dicts.
+
+    Transfers each tensor once instead of issuing a device->host sync per
+    box - with hundreds of detections the per-box scalar extraction
+    dominates post-inference time. pinned=True routes the copy through
+    the reusable pinned buffer (for per-frame callers like track).
+    """
+    boxes = r.boxes
+    if boxes is None or len(boxes) == 0:
+        return []
+
+    # One cudaMemcpy for the whole box tensor; conf/cls are the last two
+    # columns in both the (N,6) detect and (N,7) track layouts. The
+    # pinned path reads a shared buffer, so hold the lock until the rows
+    # are extracted into Python objects.
+    if pinned and boxes.data.is_cuda:
+        with _gpu_lock:
+            return _rows_to_detections(_to_host_pinned(boxes.data), r.names)
+
+    return _rows_to_detections(boxes.data.cpu().numpy(), r.names)
+
+
+def _rows_to_detections(data, names) -> list[dict]:
+    """Build detection dicts from an (N, C) host array of box rows."""
+    coords = data[:, :4]
+    confs = data[:, -2]
+    classes = data[:, -1].astype(int)
+
+    return [
+        {
+            "bbox": [float(x1), float(y1), float(x2), float(y2)],
+            "class_id": int(cls),
+            "class_name": names[int(cls)],
+            "confidence": float(conf),
+        }
+        for (x1, y1, x2, y2), conf, cls in zip(coords, confs, classes)
+    ]
+
+
+def _encode_mask(mask) -> dict:
+    """
+    Encode a binary mask compactly for JSON transport.
+
+    A 640x640 mask as nested Python bools is ~11 MB of heap per instance;
+    COCO RLE (or PNG when pycocotools is missing) is a few KB. Returns
+    {"format": "rle"|"png", "size": [h, w], "data": base64}.
+    """
+    import base64
+
+    import numpy as np
+
+    mask = np.ascontiguousarray(mask, dtype=np.uint8)
+
+    try:
+        from pycocotools import mask as mask_util
+
+        rle = mask_util.encode(np.asfortranarray(mask))
+        return {
+            "format": "rle",
+            "size": rle["size"],
+            "data": base64.b64encode(rle["counts"]).decode(),
+        }
+    except ImportError:
+        import cv2
+
+        _, buf = cv2.imencode(".png", mask * 255)
+        return {
+            "format": "png",
+            "size": list(mask.shape),
+            "data": base64.b64encode(buf.tobytes()).decode(),
+        }
+
+
+def _frame_source(video_path: str, queue_size: int = 4):
+    """
+    Decode video frames on a worker thread feeding a bounded queue.
+
+    Overlaps ffmpeg decode (and the H2D copy) with GPU inference so
+    throughput rises to the slower stage. Returns a frame generator for
+    the tracker, or None when PyAV is unavailable - ultralytics then
+    decodes inline from the path as before.
+    """
+    try:
+        import av
+    except ImportError:
+        return None
+
+    import queue
+    import threading
+
+    frames: queue.Queue = queue.Queue(maxsize=queue_size)
+    done = object()
+    errors: list[BaseException] = []
+
+    def _producer():
+        try:
+            with av.open(video_path) as container:
+                for frame in container.decode(video=0):
+                    frames.put(frame.to_ndarray(format="bgr24"))
+        except BaseException as e:
+            # Surface decode failures in the consumer instead of dying
+            # silently on this thread
+            errors.append(e)
+        finally:
+            frames.put(done)
+
+    threading.Thread(target=_producer, daemon=True).start()
+
+    def _consume():
+        while True:
+            item = frames.get()
+            if item is done:
+                if errors:
+                    raise errors[0]
+                return
+            yield item
+
+    return _consume()
+
+
+def _resolve_model(model: str, device: str) -> str:
+    """
+    Resolve a .pt model to a cached TensorRT FP16 engine when possible.
+
+    TRT layer fusion + FP16 roughly halves per-frame latency on the conv
+    stack; engines are device-specific, so they are exported once next to
+    the .pt weights (inside the persistent weights dir when configured,
+    so the export cost is paid once ever, not per container) and reused
+    from disk afterwards. Falls back to the .pt path when TensorRT is
+    unavailable.
+    """
+    model = _weights_path(model)
+
+    if device != "cuda" or not model.endswith(".pt"):
+        return model
+
+    engine_path = Path(model).with_suffix(".engine")
+    if engine_path.exists():
+        return str(engine_path)
+
+    try:
+        from ultralytics import YOLO
+
+        YOLO(model).export(format="engine", half=True, dynamic=True, imgsz=640)
+    except Exception:
+        # TensorRT not installed / unsupported GPU - stay on PyTorch
+        return model
+
+    return str(engine_path) if engine_path.exists() else model
+
+
 @task(
     name="image.detect",
     tags=["image", "ai", "detect"],
+    aliases=["yolo.detect"],
     gpu="T4",
     timeout=300,
 )
@@ -23,27 +276,20 @@ def detect(
     device: str = "cuda",
 ) -> list[dict]:
     """Detect objects in image using YOLO."""
-    from ultralytics import YOLO
-
-    yolo = YOLO(model)
+    yolo = _get_yolo(model, device)
     results = yolo.predict(
         image_path,
         conf=conf,
         iou=iou,
         classes=classes,
         device=device,
+        half=device == "cuda",
         verbose=False,
     )
 
     detections = []
     for r in results:
-        for i, box in enumerate(r.boxes):
-            detections.append({
-                "bbox": box.xyxy[0].tolist(),
-                "class_id": int(box.cls[0]),
-                "class_name": r.names[int(box.cls[0])],
-                "confidence": float(box.conf[0]),
-            })
+        detections.extend(_boxes_to_detections(r))
 
     return detections
 
@@ -61,28 +307,28 @@ def segment(
     device: str = "cuda",
 ) -> list[dict]:
     """Instance segmentation using YOLO-Seg."""
-    from ultralytics import YOLO
-
-    yolo = YOLO(model)
+    yolo = _get_yolo(model, device)
     results = yolo.predict(
         image_path,
         conf=conf,
         device=device,
+        half=device == "cuda",
         verbose=False,
     )
 
+    import torch
+
     segments = []
     for r in results:
         if r.masks is None:
             continue
-        for i, (box, mask) in enumerate(zip(r.boxes, r.masks)):
-            segments.append({
-                "bbox": box.xyxy[0].tolist(),
-                "class_id": int(box.cls[0]),
-                "class_name": r.names[int(box.cls[0])],
-                "confidence": float(box.conf[0]),
-                "mask": mask.data[0].cpu().numpy().astype(bool).tolist(),
-            })
+
+        # One stacked device->host copy for all masks of the frame
+        all_masks = r.masks.data.to(torch.uint8).cpu().numpy()
+
+        for det, mask in zip(_boxes_to_detections(r), all_masks):
+            det["mask_rle"] = _encode_mask(mask)
+            segments.append(det)
 
     return segments
 
@@ -100,13 +346,12 @@ def pose(
     device: str = "cuda",
 ) -> list[dict]:
     """Pose estimation using YOLO-Pose."""
-    from ultralytics import YOLO
-
-    yolo = YOLO(model)
+    yolo = _get_yolo(model, device)
     results = yolo.predict(
         image_path,
         conf=conf,
         device=device,
+        half=device == "cuda",
         verbose=False,
     )
 
@@ -114,17 +359,25 @@ def pose(
     for r in results:
         if r.keypoints is None:
             continue
-        for i, (box, kpts) in enumerate(zip(r.boxes, r.keypoints)):
-            keypoints = []
-            for j, kpt in enumerate(kpts.data[0]):
-                keypoints.append({
+
+        # Bulk-transfer keypoints and boxes once per frame
+        all_kpts = r.keypoints.data.cpu().numpy()
+        all_boxes = r.boxes.xyxy.cpu().numpy()
+        all_confs = r.boxes.conf.cpu().numpy()
+
+        for box, conf, kpts in zip(all_boxes, all_confs, all_kpts):
+            has_conf = kpts.shape[-1] > 2
+            keypoints = [
+                {
                     "x": float(kpt[0]),
                     "y": float(kpt[1]),
-                    "confidence": float(kpt[2]) if len(kpt) > 2 else 1.0,
-                })
+                    "confidence": float(kpt[2]) if has_conf else 1.0,
+                }
+                for kpt in kpts
+            ]
             poses.append({
-                "bbox": box.xyxy[0].tolist(),
-                "confidence": float(box.conf[0]),
+                "bbox": [float(v) for v in box],
+                "confidence": float(conf),
                 "keypoints": keypoints,
             })
 
@@ -142,28 +395,89 @@ def detect_batch(
     model: str = "yolo11n.pt",
     conf: float = 0.25,
     device: str = "cuda",
+    imgsz: int = 640,
 ) -> list[list[dict]]:
-    """Batch detection for multiple images."""
-    from ultralytics import YOLO
+    """
+    Batch detection for multiple images.
 
-    yolo = YOLO(model)
-    results = yolo.predict(
-        image_paths,
-        conf=conf,
-        device=device,
-        verbose=False,
-    )
+    Decodes and resizes on CPU threads, stacks everything into one
+    (B, 3, imgsz, imgsz) CUDA tensor and runs a single batched forward
+    pass - one kernel launch sequence instead of N sequential predicts.
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
+    import cv2
+    import numpy as np
+    import torch
+
+    yolo = _get_yolo(model, device)
+
+    if device != "cuda":
+        # CPU path: let ultralytics iterate the path list
+        results = yolo.predict(image_paths, conf=conf, device=device, verbose=False)
+        return [_boxes_to_detections(r) for r in results]
+
+    b = len(image_paths)
+
+    # The staging buffers (and the cached model) are shared process
+    # state - hold the lock from buffer fill through the forward pass
+    with _gpu_lock:
+        pinned, gpu, copy_stream = _get_staging(b, imgsz)
+
+        # Worker threads decode straight into the pinned staging buffer
+        pinned_np = pinned.numpy()
+        scales: list = [None] * b
+
+        def _load(i: int, path: str) -> None:
+            img = cv2.imread(path)
+            h, w = img.shape[:2]
+
+            # Letterbox like ultralytics' own preprocessing - squashing
+            # to a square distorts aspect ratio and changes detections
+            scale = min(imgsz / w, imgsz / h)
+            new_w = max(round(w * scale), 1)
+            new_h = max(round(h * scale), 1)
+            top = (imgsz - new_h) // 2
+            left = (imgsz - new_w) // 2
+
+            pinned_np[i].fill(114)  # ultralytics' pad color
+            pinned_np[i][top:top + new_h, left:left + new_w] = cv2.resize(
+                img, (new_w, new_h)
+            )
+            scales[i] = (scale, left, top)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda args: _load(*args), enumerate(image_paths)))
+
+        # Async H2D copy on a dedicated stream, overlapping default-stream
+        # work
+        with torch.cuda.stream(copy_stream):
+            gpu[:b].copy_(pinned[:b], non_blocking=True)
+        torch.cuda.current_stream().wait_stream(copy_stream)
+
+        tensor = (
+            gpu[:b]
+            .permute(0, 3, 1, 2)
+            .flip(1)  # BGR -> RGB
+            .float()
+            .div_(255)
+        )
+
+        results = yolo(tensor, conf=conf, verbose=False)
+
+    # Boxes come back in letterboxed imgsz-space; undo the padding and
+    # scale to original image coords
     all_detections = []
-    for r in results:
-        detections = []
-        for box in r.boxes:
-            detections.append({
-                "bbox": box.xyxy[0].tolist(),
-                "class_id": int(box.cls[0]),
-                "class_name": r.names[int(box.cls[0])],
-                "confidence": float(box.conf[0]),
-            })
+    for (scale, left, top), r in zip(scales, results):
+        detections = _boxes_to_detections(r)
+        for det in detections:
+            x1, y1, x2, y2 = det["bbox"]
+            det["bbox"] = [
+                (x1 - left) / scale,
+                (y1 - top) / scale,
+                (x2 - left) / scale,
+                (y2 - top) / scale,
+            ]
         all_detections.append(detections)
 
     return all_detections
@@ -174,6 +488,7 @@ def detect_batch(
     tags=["video", "image", "ai", "detect", "track"],
     gpu="T4",
     timeout=600,
+    streaming=True,
 )
 def track(
     video_path: str,
@@ -181,34 +496,65 @@ def track(
     conf: float = 0.25,
     tracker: str = "bytetrack.yaml",
     device: str = "cuda",
-) -> list[dict]:
-    """Track objects in video using YOLO + ByteTrack."""
-    from ultralytics import YOLO
+) -> Generator[dict, None, None]:
+    """
+    Track objects in video using YOLO + ByteTrack.
 
-    yolo = YOLO(model)
-    results = yolo.track(
-        video_path,
-        conf=conf,
-        tracker=tracker,
-        device=device,
-        verbose=False,
-        persist=True,
-    )
+    Yields one result per frame as it is produced, so memory stays
+    bounded regardless of video length and consumers can start
+    processing immediately.
+    """
+    yolo = _get_yolo(model, device)
+
+    # The cached model carries ByteTrack state from earlier calls in
+    # this process - reset so track IDs start fresh for this video
+    predictor = getattr(yolo, "predictor", None)
+    if predictor is not None:
+        for frame_tracker in getattr(predictor, "trackers", None) or []:
+            if hasattr(frame_tracker, "reset"):
+                frame_tracker.reset()
+
+    # Decode on a separate thread when PyAV is available
+    source = _frame_source(video_path)
+
+    if source is not None:
+        # Ultralytics only accepts paths/arrays/tensors as sources (not
+        # generators), so run one track() call per decoded frame -
+        # persist=True keeps ID continuity across the calls
+        results = (
+            yolo.track(
+                frame,
+                conf=conf,
+                tracker=tracker,
+                device=device,
+                half=device == "cuda",
+                persist=True,
+                verbose=False,
+            )[0]
+            for frame in source
+        )
+    else:
+        results = yolo.track(
+            video_path,
+            conf=conf,
+            tracker=tracker,
+            device=device,
+            half=device == "cuda",
+            stream=True,
+            verbose=False,
+            persist=True,
+        )
 
-    tracks = []
     for frame_idx, r in enumerate(results):
         if r.boxes.id is None:
             continue
-        for box in r.boxes:
-            if box.id is None:
-                continue
-            tracks.append({
-                "frame": frame_idx,
-                "track_id": int(box.id[0]),
-                "bbox": box.xyxy[0].tolist(),
-                "class_id": int(box.cls[0]),
-                "class_name": r.names[int(box.cls[0])],
-                "confidence": float(box.conf[0]),
-            })
 
-    return tracks
+        ids = r.boxes.id.int().cpu().numpy()
+
+        yield {
+            "frame": frame_idx,
+            "detections": [
+                {"track_id": int(track_id), **det}
+                for track_id, det in zip(ids, _boxes_to_detections(r, pinned=True))
+            ],
+        }
@@ -9,13 +9,30 @@ import json
 
 from ..decorator import task
 
+# orjson (C/SIMD) är 3-10x snabbare på stora scheman/svar; stdlib som fallback
+try:
+    import orjson
+
+    def _json_loads(data: str) -> dict:
+        return orjson.loads(data)
+
+    def _json_dumps_pretty(obj: dict) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json_loads(data: str) -> dict:
+        return json.loads(data)
+
+    def _json_dumps_pretty(obj: dict) -> str:
+        return json.dumps(obj, indent=2)
+
 # Standard schema - samma för alla providers!
-from ...schemas.chat import ChatPayload, ChatResponse
+from schemas.chat import ChatPayload, ChatResponse
 
 
 @task(
     name="openai.chat",
     tags=["text", "ai", "generate"],
+    aliases=["llm.chat"],
     gpu=None,  # OpenAI är API-baserat
     timeout=120,
 )
@@ -92,6 +109,12 @@ def embed(
     """Generate embeddings for text."""
     import openai
 
+    if isinstance(text, list) and len(text) > 2048:
+        # Over the API's per-request input limit - fan out async
+        import asyncio
+
+        return asyncio.run(embed_async(text, model=model))
+
     response = openai.embeddings.create(model=model, input=text)
 
     if isinstance(text, str):
@@ -99,6 +122,33 @@ def embed(
     return [d.embedding for d in response.data]
 
 
+async def embed_async(
+    texts: list[str],
+    model: str = "text-embedding-3-small",
+) -> list[list[float]]:
+    """
+    Embed many texts concurrently.
+
+    Splits the input into <=2048-item batches (the API limit) and keeps
+    up to 16 requests in flight - near-linear scaling for bursts that
+    would otherwise serialize.
+    """
+    import asyncio
+    import openai
+
+    client = openai.AsyncOpenAI()
+    semaphore = asyncio.Semaphore(16)
+
+    async def _embed(chunk: list[str]) -> list[list[float]]:
+        async with semaphore:
+            response = await client.embeddings.create(model=model, input=chunk)
+            return [d.embedding for d in response.data]
+
+    chunks = [texts[i:i + 2048] for i in range(0, len(texts), 2048)]
+    results = await asyncio.gather(*(_embed(chunk) for chunk in chunks))
+    return [embedding for chunk in results for embedding in chunk]
+
+
 @task(
     name="openai.summarize",
     tags=["text", "ai", "generate"],
@@ -107,7 +157,7 @@ def embed(
 )
 def summarize(text: str, max_length: int = 200, style: str = "concise") -> str:
     """Summarize text using LLM."""
-    from ...schemas.chat import Message
+    from schemas.chat import Message
 
     prompts = {
         "concise": f"Summarize in {max_length} chars or less:\n\n{text}",
@@ -132,25 +182,24 @@ def summarize(text: str, max_length: int = 200, style: str = "concise") -> str:
 )
 def extract(text: str, schema: dict) -> dict:
     """Extract structured data from text."""
-    from ...schemas.chat import Message
-
-    prompt = f"""Extract information according to this JSON schema:
-
-Schema:
-{json.dumps(schema, indent=2)}
-
-Text:
-{text}
-
-Respond with valid JSON only."""
+    import openai
 
-    payload = ChatPayload(
-        messages=[Message(role="user", content=prompt)],
+    # Native structured outputs: the API enforces the schema server-side,
+    # so there are no parse-failure retries and the prompt doesn't spend
+    # tokens re-describing the schema
+    response = openai.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "user", "content": f"Extract information from this text:\n\n{text}"}
+        ],
         temperature=0,
+        response_format={
+            "type": "json_schema",
+            "json_schema": {"name": "extract", "schema": schema, "strict": True},
+        },
     )
 
-    result = chat(payload)
-    return json.loads(result.content)
+    return _json_loads(response.choices[0].message.content)
 
 
 @task(
@@ -161,22 +210,33 @@ Respond with valid JSON only."""
 )
 def classify(text: str, categories: list[str]) -> dict:
     """Classify text into categories."""
-    from ...schemas.chat import Message
-
-    categories_str = ", ".join(categories)
-    prompt = f"""Classify into one of: {categories_str}
+    import openai
 
-Text: {text}
+    # The enum constraint guarantees the category is one of the inputs
+    schema = {
+        "type": "object",
+        "properties": {
+            "category": {"type": "string", "enum": categories},
+            "confidence": {"type": "number"},
+            "reasoning": {"type": "string"},
+        },
+        "required": ["category", "confidence", "reasoning"],
+        "additionalProperties": False,
+    }
 
-Respond with JSON: {{"category": "...", "confidence": 0.0-1.0, "reasoning": "..."}}"""
+    prompt = f"Classify into one of: {', '.join(categories)}\n\nText: {text}"
 
-    payload = ChatPayload(
-        messages=[Message(role="user", content=prompt)],
+    response = openai.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": prompt}],
         temperature=0,
+        response_format={
+            "type": "json_schema",
+            "json_schema": {"name": "classify", "schema": schema, "strict": True},
+        },
     )
 
-    result = chat(payload)
-    return json.loads(result.content)
+    return _json_loads(response.choices[0].message.content)
 
 
 @task(
@@ -187,7 +247,7 @@ Respond with JSON: {{"category": "...", "confidence": 0.0-1.0, "reasoning": "...
 )
 def translate(text: str, target_language: str, source_language: str = None) -> str:
     """Translate text."""
-    from ...schemas.chat import Message
+    from schemas.chat import Message
 
     source = f"from {source_language} " if source_language else ""
     prompt = f"Translate {source}to {target_language}. Only output the translation:\n\n{text}"
@@ -210,13 +270,93 @@ from typing import Generator
 from ..decorator import task
 
 # Använder SAMMA schema som OpenAI
-from ...schemas.chat import ChatPayload, ChatResponse, Message
+from schemas.chat import ChatPayload, ChatResponse, Message
+
+
+_QWEN_MODEL = "Qwen/Qwen2-7B-Instruct"
+
+# Global model cache (mirrors chatterbox's _get_model pattern) - a 7B
+# reload per request costs tens of GB of disk/VRAM I/O
+_tokenizer = None
+_model = None
+
+
+def _load_qwen():
+    """Get or create the Qwen tokenizer + model (loaded once per process)."""
+    global _tokenizer, _model
+
+    if _model is None:
+        import torch
+        from transformers import AutoModelForCausalLM, AutoTokenizer
+
+        _tokenizer = AutoTokenizer.from_pretrained(_QWEN_MODEL)
+        # fp16 rather than bf16 - the fallback may land on pre-Ampere
+        # GPUs where bf16 is unsupported
+        _model = AutoModelForCausalLM.from_pretrained(
+            _QWEN_MODEL, device_map="auto", torch_dtype=torch.float16
+        )
+
+    return _tokenizer, _model
+
+
+# AWQ-INT4 build av samma modell - ~4 GB vikter istället för ~14 GB, så
+# den får plats på en T4, och decode (bandbreddsbundet) går 2-4x fortare
+_QWEN_AWQ_MODEL = "Qwen/Qwen2-7B-Instruct-AWQ"
+
+_vllm = None
+_vllm_quant = None
+
+
+def _load_vllm(quant: str = "awq"):
+    """
+    Get or create the vLLM engine, or None when vLLM is unavailable.
+
+    vLLM's continuous batching + PagedAttention shares kernel launches
+    across concurrent chats; the HF generate() path serves one request
+    at a time with the GPU idle between decode steps. quant="awq"
+    (default) loads the INT4 build; anything else keeps full bf16.
+    """
+    global _vllm, _vllm_quant
+
+    if _vllm is None or _vllm_quant != quant:
+        try:
+            from vllm import LLM
+        except ImportError:
+            return None
+
+        if quant == "awq":
+            _vllm = LLM(
+                model=_QWEN_AWQ_MODEL,
+                quantization="awq",
+                dtype="float16",
+                gpu_memory_utilization=0.9,
+            )
+        else:
+            _vllm = LLM(
+                model=_QWEN_MODEL, dtype="bfloat16", gpu_memory_utilization=0.9
+            )
+
+        _vllm_quant = quant
+
+    return _vllm
+
+
+def clear_cache():
+    """Clear model cache to free VRAM."""
+    global _tokenizer, _model, _vllm
+    _tokenizer = None
+    _model = None
+    _vllm = None
+
+    import torch
+    if torch.cuda.is_initialized():
+        torch.cuda.empty_cache()
 
 
 @task(
     name="qwen.chat",
     tags=["text", "ai", "generate"],
-    gpu="A10G",  # Qwen kör lokalt på GPU
+    gpu="A10G",  # a10g-profilen är den enda vars image har vllm/transformers
     timeout=120,
 )
 def chat(payload: ChatPayload) -> ChatResponse:
@@ -225,16 +365,34 @@ def chat(payload: ChatPayload) -> ChatResponse:
 
     Accepterar EXAKT samma payload som openai.chat!
     """
-    # Konvertera till Qwen-format internt
-    from transformers import AutoModelForCausalLM, AutoTokenizer
-
-    model_name = "Qwen/Qwen2-7B-Instruct"
-    tokenizer = AutoTokenizer.from_pretrained(model_name)
-    model = AutoModelForCausalLM.from_pretrained(model_name, device_map="auto")
-
     # Bygg prompt från messages
     prompt = _build_prompt(payload.messages)
 
+    # Föredra vLLM (continuous batching); falla tillbaka på transformers
+    llm = _load_vllm()
+    if llm is not None:
+        from vllm import SamplingParams
+
+        output = llm.generate(
+            [prompt],
+            SamplingParams(
+                temperature=payload.temperature,
+                # ChatPayload defaults top_p to None, which vLLM's arg
+                # verification rejects - map it to vLLM's own default
+                top_p=payload.top_p if payload.top_p is not None else 1.0,
+                max_tokens=payload.max_tokens or 512,
+                stop=payload.stop,
+            ),
+        )[0].outputs[0]
+
+        return ChatResponse(
+            content=output.text,
+            model=_QWEN_MODEL,
+            usage={"total_tokens": len(output.token_ids)},
+        )
+
+    tokenizer, model = _load_qwen()
+
     inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
     outputs = model.generate(
         **inputs,
@@ -247,7 +405,7 @@ def chat(payload: ChatPayload) -> ChatResponse:
 
     return ChatResponse(
         content=response_text,
-        model=model_name,
+        model=_QWEN_MODEL,
         usage={"total_tokens": len(outputs[0])},
     )
 
@@ -261,12 +419,10 @@ def chat(payload: ChatPayload) -> ChatResponse:
 )
 def chat_stream(payload: ChatPayload) -> Generator[ChatResponse, None, None]:
     """Streaming chat with Qwen."""
-    from transformers import AutoModelForCausalLM, AutoTokenizer, TextIteratorStreamer
+    from transformers import TextIteratorStreamer
     from threading import Thread
 
-    model_name = "Qwen/Qwen2-7B-Instruct"
-    tokenizer = AutoTokenizer.from_pretrained(model_name)
-    model = AutoModelForCausalLM.from_pretrained(model_name, device_map="auto")
+    tokenizer, model = _load_qwen()
 
     prompt = _build_prompt(payload.messages)
     inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
@@ -283,7 +439,7 @@ def chat_stream(payload: ChatPayload) -> Generator[ChatResponse, None, None]:
     for text in streamer:
         yield ChatResponse(
             content=text,
-            model=model_name,
+            model=_QWEN_MODEL,
             is_partial=True,
         )
 
@@ -3,18 +3,33 @@ Type definitions for the task decorator system.
 """
 
 from dataclasses import dataclass, field
-from typing import Callable, Optional, Any, Generator, Type
+from functools import cache
+from typing import Callable, Optional, Any, Generator, Sequence, Type
 
-# Optional Pydantic support
-try:
-    from pydantic import BaseModel
-    HAS_PYDANTIC = True
-except ImportError:
-    BaseModel = None  # type: ignore
-    HAS_PYDANTIC = False
 
+# Optional Pydantic support, resolved lazily - importing pydantic
+# compiles validator machinery, which registry-only consumers (CLI
+# listings, discovery) never need
+@cache
+def _basemodel():
+    """Return pydantic.BaseModel, or None when pydantic is missing."""
+    try:
+        from pydantic import BaseModel
+    except ImportError:
+        return None
+    return BaseModel
 
-@dataclass
+
+def __getattr__(name):
+    # Keep the historical module-level names without the eager import
+    if name == "BaseModel":
+        return _basemodel()
+    if name == "HAS_PYDANTIC":
+        return _basemodel() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@dataclass(slots=True)
 class ChunkConfig:
     """Configuration for chunking long-running tasks."""
 
@@ -31,7 +46,44 @@ class ChunkConfig:
     """How to merge results: 'concat', 'concat_segments', 'aggregate'."""
 
 
-@dataclass
+# Shared validator cache keyed by schema class - tasks reusing the same
+# input model (common payload shapes) share one compiled pydantic-core
+# validator instead of each building their own
+_ADAPTER_CACHE: dict[type, Callable] = {}
+
+
+def _adapter_validate(schema: type) -> Callable:
+    """Get (or build) the cached validate callable for a model class."""
+    validate = _ADAPTER_CACHE.get(schema)
+
+    if validate is None:
+        from pydantic import TypeAdapter
+
+        try:
+            validate = TypeAdapter(schema).validate_python
+        except Exception:
+            validate = schema.model_validate
+        _ADAPTER_CACHE[schema] = validate
+
+    return validate
+
+
+# Source templates for the specialized per-task execute. Each bound
+# callable arrives as a default argument, so the generated function has
+# no closure-cell or attribute lookups at call time.
+_EXEC_TEMPLATES = {
+    (True, True): "def _exec(payload, _v=_v, _f=_f, _d=_d):\n"
+                  "    return _d(_f(_v(payload)))",
+    (True, False): "def _exec(payload, _v=_v, _f=_f):\n"
+                   "    return _f(_v(payload))",
+    (False, True): "def _exec(payload, _f=_f, _d=_d):\n"
+                   "    return _d(_f(**payload))",
+    (False, False): "def _exec(payload, _f=_f):\n"
+                    "    return _f(**payload)",
+}
+
+
+@dataclass(slots=True)
 class TaskMeta:
     """Metadata for a registered task."""
 
@@ -41,8 +93,12 @@ class TaskMeta:
     func: Callable[..., Any]
     """The actual task function."""
 
-    tags: list[str] = field(default_factory=list)
-    """Task tags (e.g., ['audio', 'text', 'ai', 'gpu'])."""
+    tags: Sequence[str] = ()
+    """Task tags (e.g., ['audio', 'text', 'ai', 'gpu']). The shared empty
+    tuple default avoids a list() factory call per instantiation."""
+
+    aliases: Sequence[str] = ()
+    """Alternate names resolving to this task (e.g., legacy names)."""
 
     gpu: Optional[str] = None
     """GPU type required (None, 'T4', 'A10G', 'A100')."""
@@ -65,6 +121,173 @@ class TaskMeta:
     output_schema: Optional[Type] = None
     """Optional Pydantic model for output validation."""
 
+    trust_output: bool = False
+    """Skip output validation (model_construct) - only for handlers whose
+    output shape is controlled by our own code."""
+
+    batch: bool = False
+    """Whether the function accepts a whole batch (list) in one call."""
+
+    id: Optional[int] = field(init=False, repr=False, compare=False, default=None)
+    """Positional id assigned at registration (index into the id table)."""
+
+    tags_set: frozenset = field(init=False, repr=False, compare=False, default=frozenset())
+    """Frozenset view of tags for O(1) membership checks."""
+
+    _dict_cache: Optional[dict] = field(init=False, repr=False, compare=False, default=None)
+    """Cached to_dict() result (metadata is immutable after registration)."""
+
+    _validate: Optional[Callable] = field(init=False, repr=False, compare=False, default=None)
+    """Pre-bound input validator (None when no input schema applies)."""
+
+    _dump: Optional[Callable] = field(init=False, repr=False, compare=False, default=None)
+    """Pre-bound output dumper (None when no output schema applies)."""
+
+    _input_is_model: bool = field(init=False, repr=False, compare=False, default=False)
+    """Whether input_schema is a Pydantic model (computed once)."""
+
+    _output_is_model: bool = field(init=False, repr=False, compare=False, default=False)
+    """Whether output_schema is a Pydantic model (computed once)."""
+
+    _execute: Optional[Callable] = field(init=False, repr=False, compare=False, default=None)
+    """Shape-specialized execute built at registration (see execute())."""
+
+    _validate_many: Optional[Callable] = field(init=False, repr=False, compare=False, default=None)
+    """Lazily-built list[input_schema] batch validator."""
+
+    _decoder: Optional[Any] = field(init=False, repr=False, compare=False, default=None)
+    """msgspec JSON decoder, when the input schema is a msgspec Struct."""
+
+    _encoder: Optional[Any] = field(init=False, repr=False, compare=False, default=None)
+    """msgspec JSON encoder paired with _decoder."""
+
+    def __post_init__(self):
+        # Frozenset view of tags for O(1) membership checks
+        self.tags_set = frozenset(self.tags)
+
+        # Resolve the schema checks once at registration so the execute
+        # hot path has no issubclass/branch work per call; only touch
+        # pydantic at all when a schema was declared
+        base_model = _basemodel() if (self.input_schema or self.output_schema) else None
+
+        self._input_is_model = bool(
+            base_model and self.input_schema and issubclass(self.input_schema, base_model)
+        )
+        self._output_is_model = bool(
+            base_model and self.output_schema and issubclass(self.output_schema, base_model)
+        )
+
+        if self._input_is_model:
+            # Compiled once per schema class and shared across tasks
+            self._validate = _adapter_validate(self.input_schema)
+
+        if self._output_is_model:
+            self._dump = lambda result, _bm=base_model: (
+                result.model_dump() if isinstance(result, _bm) else result
+            )
+
+        # msgspec compiles schema decoders/encoders ahead of time and is
+        # several times faster than Pydantic + json for schematic JSON;
+        # only engages when the schema actually is a msgspec Struct
+        try:
+            import msgspec
+        except ImportError:
+            pass
+        else:
+            if (
+                isinstance(self.input_schema, type)
+                and issubclass(self.input_schema, msgspec.Struct)
+            ):
+                self._decoder = msgspec.json.Decoder(self.input_schema)
+                self._encoder = msgspec.json.Encoder()
+
+        # Compile a shape-specialized execute for this task: the fixed
+        # (validate?, dump?) combination picks a template, so the per-call
+        # path carries no branches at all
+        namespace = {"_v": self._validate, "_f": self.func, "_d": self._dump}
+        source = _EXEC_TEMPLATES[(self._validate is not None, self._dump is not None)]
+        exec(compile(source, f"<dwa:{self.name}>", "exec"), namespace)
+        self._execute = namespace["_exec"]
+
+    def execute_bytes(self, raw: bytes) -> bytes:
+        """
+        Decode raw JSON, run the task, and encode the result to bytes.
+
+        Takes the msgspec fast path when the schemas are msgspec Structs,
+        bypassing Pydantic entirely; otherwise delegates to execute()
+        with stdlib JSON at the edges.
+        """
+        if self._decoder is not None:
+            result = self.func(self._decoder.decode(raw))
+            return self._encoder.encode(result)
+
+        import json
+
+        return json.dumps(self.execute(json.loads(raw))).encode()
+
+    def execute_many(self, payloads: list[dict]) -> list[Any]:
+        """
+        Run the task over a batch of payloads.
+
+        With an input schema, the whole batch is validated in one
+        pydantic-core call instead of N crossings. batch=True functions
+        receive the validated list in a single invocation; others run
+        once per item.
+        """
+        if self._input_is_model:
+            if self._validate_many is None:
+                from pydantic import TypeAdapter
+
+                self._validate_many = TypeAdapter(
+                    list[self.input_schema]
+                ).validate_python
+            validated = self._validate_many(payloads)
+        else:
+            validated = payloads
+
+        if self.batch:
+            results = self.func(validated)
+        elif self._input_is_model:
+            results = [self.func(item) for item in validated]
+        else:
+            results = [self.func(**item) for item in validated]
+
+        if self._dump is not None:
+            return [self._dump(result) for result in results]
+        return results
+
+    def execute_to_bytes(self, payload: dict) -> bytes:
+        """
+        Run the task and return the result as JSON bytes.
+
+        Model outputs serialize through model_dump_json (pydantic's
+        Rust-native serializer) in a single traversal, skipping the
+        model -> dict -> JSON double walk that dump-then-encode costs.
+        """
+        if self._validate is not None:
+            result = self.func(self._validate(payload))
+        else:
+            result = self.func(**payload)
+
+        if self._output_is_model and isinstance(result, self.output_schema):
+            return result.model_dump_json().encode()
+
+        import json
+
+        return json.dumps(self._dump(result) if self._dump else result).encode()
+
+    def execute(self, payload: dict) -> Any:
+        """
+        Run the task on a payload dict.
+
+        Validates input when an input schema is declared (schema-less
+        tasks get the payload as kwargs), calls the function, and dumps
+        schema outputs back to plain data. Dispatches through the
+        specialized function compiled at registration, so the per-call
+        path is branch-free.
+        """
+        return self._execute(payload)
+
     @property
     def is_gpu_task(self) -> bool:
         """Check if task requires GPU."""
@@ -77,15 +300,15 @@ class TaskMeta:
 
     def has_tag(self, tag: str) -> bool:
         """Check if task has a specific tag."""
-        return tag in self.tags
+        return tag in self.tags_set
 
     def has_all_tags(self, tags: list[str]) -> bool:
         """Check if task has all specified tags."""
-        return all(t in self.tags for t in tags)
+        return self.tags_set.issuperset(tags)
 
     def has_any_tag(self, tags: list[str]) -> bool:
         """Check if task has any of the specified tags."""
-        return any(t in self.tags for t in tags)
+        return not self.tags_set.isdisjoint(tags)
 
     @property
     def has_schema(self) -> bool:
@@ -94,23 +317,36 @@ class TaskMeta:
 
     def validate_input(self, data: dict) -> Any:
         """Validate input data against schema (if defined)."""
-        if self.input_schema and HAS_PYDANTIC and issubclass(self.input_schema, BaseModel):
-            return self.input_schema.model_validate(data)
+        if self._validate is not None:
+            return self._validate(data)
         return data
 
     def validate_output(self, data: Any) -> Any:
         """Validate output data against schema (if defined)."""
-        if self.output_schema and HAS_PYDANTIC and issubclass(self.output_schema, BaseModel):
+        if self._output_is_model:
             if isinstance(data, self.output_schema):
                 return data
+            if self.trust_output and isinstance(data, dict):
+                # Trusted internal producer - build without field validation
+                return self.output_schema.model_construct(**data)
             return self.output_schema.model_validate(data)
         return data
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for serialization."""
+        """
+        Convert to dictionary for serialization.
+
+        Cached after the first call - the Pydantic model_json_schema
+        builds in particular are expensive, and task metadata never
+        changes once registered.
+        """
+        if self._dict_cache is not None:
+            return self._dict_cache
+
         result = {
             "name": self.name,
             "tags": self.tags,
+            "aliases": self.aliases,
             "gpu": self.gpu,
             "timeout": self.timeout,
             "streaming": self.streaming,
@@ -124,9 +360,10 @@ class TaskMeta:
         }
 
         # Add JSON Schema if Pydantic models are defined
-        if self.input_schema and HAS_PYDANTIC and issubclass(self.input_schema, BaseModel):
+        if self._input_is_model:
             result["input_schema"] = self.input_schema.model_json_schema()
-        if self.output_schema and HAS_PYDANTIC and issubclass(self.output_schema, BaseModel):
+        if self._output_is_model:
             result["output_schema"] = self.output_schema.model_json_schema()
 
+        self._dict_cache = result
         return result
@@ -7,7 +7,7 @@ from typing import Optional
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class GpuInfo:
     """Information about a GPU."""
     index: int
@@ -18,7 +18,7 @@ class GpuInfo:
     utilization: float  # 0-100%
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSnapshot:
     """Snapshot of system resources."""
     gpus: list[GpuInfo] = field(default_factory=list)